@@ -18,15 +18,83 @@ if hasattr(ic, "configureOutput"):
 ic.disable()
 
 
-import math, collections
-from random import randint
+import math, collections, operator
+from functools import lru_cache
 from enum import Enum
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 from runner import DisplayConfig
 
 ###------------------------------------------------------------------------------###
 # Helper Functions
 
+def _pixel_arrays(pixels):
+    """Convert a list of (x, y, brightness) tuples into parallel (xs, ys, bs) arrays."""
+    if not pixels:
+        return np.empty(0, np.int16), np.empty(0, np.int16), np.empty(0, np.float64)
+    xs, ys, bs = zip(*pixels)
+    return np.array(xs, np.int16), np.array(ys, np.int16), np.array(bs, np.float64)
+
+def _pixel_list(xs, ys, bs):
+    """Convert parallel (xs, ys, bs) arrays into a list of (x, y, brightness) tuples."""
+    return list(zip(xs.tolist(), ys.tolist(), bs.tolist()))
+
+_rng = np.random.default_rng()
+
+class _RandomInts:
+    """
+    Random ints in [low, high], drawn from numpy in batches.
+
+    Handing out values from a pre-drawn batch is much cheaper than a
+    random.randint() call each time, which matters for effects that
+    re-roll their state on every reset (e.g. Sparkle).
+    """
+    def __init__(self, low: int, high: int, batch: int = 256):
+        self.low = low
+        self.high = high
+        self.batch = batch
+        self._pool: list[int] = []
+        self._index = 0
+
+    def draw(self) -> int:
+        if self._index >= len(self._pool):
+            self._pool = _rng.integers(self.low, self.high + 1, self.batch).tolist()
+            self._index = 0
+        value = self._pool[self._index]
+        self._index += 1
+        return value
+
+# The geometry tables below only depend on their arguments, so they are
+# built once per distinct shape and shared (read-only) by every effect
+# instance that asks for the same one.
+
+@lru_cache(maxsize=None)
+def _ring_order(length):
+    """
+    Read order table for a ring buffer of `length` slots.
+
+    Row `head` lists the slot indices newest-first when the latest write
+    went to slot `head`, so a trail of n entries is ring[order[head, :n]].
+    """
+    steps = np.arange(length)
+    order = (steps[:, None] - steps[None, :]) % length
+    order.flags.writeable = False
+    return order
+
+@lru_cache(maxsize=64)
+def _dist_grid(w, h, cx, cy):
+    """Distance from (cx, cy) to every pixel of a w x h display, indexed [x, y]."""
+    xs, ys = np.meshgrid(np.arange(w), np.arange(h), indexing="ij")
+    dist = np.hypot(xs - cx, ys - cy)
+    dist.flags.writeable = False
+    return dist
+
 class BlendMode(Enum):
     """
     Enumeration of pixel blending strategies used when combining layers.
@@ -47,16 +115,60 @@ class BlendMode(Enum):
     ALPHA_HARD = "alpha_hard"
     OVERWRITE = "overwrite"
 
+def _overwrite(dst, src):
+    return src
+
+# How each BlendMode combines a destination and source brightness. Looked up
+# once per call instead of walking a chain of enum comparisons; any unknown
+# mode falls back to OVERWRITE.
+_BLENDERS = {
+    BlendMode.MAX: max,
+    BlendMode.ADD: operator.add,
+    BlendMode.ALPHA_SOFT: lambda d, s: d * 0.75 + s * 0.25,
+    BlendMode.ALPHA_HARD: lambda d, s: d * 0.4 + s * 0.6,
+    BlendMode.OVERWRITE: _overwrite,
+}
+
+# Same table for whole numpy arrays of pixels
+_ARRAY_BLENDERS = dict(_BLENDERS)
+_ARRAY_BLENDERS[BlendMode.MAX] = np.maximum
+
+def _pointwise_merge(blender):
+    """
+    Build a canvas merge that blends pixels one occurrence at a time.
+
+    A layer can emit the same pixel more than once (e.g. a tail crossing
+    itself). The first occurrence of every pixel is blended, then the
+    second, and so on, so repeats stack in emit order.
+    """
+    def merge(canvas, idx, bs):
+        while idx.size:
+            _, first = np.unique(idx, return_index=True)
+            canvas[idx[first]] = blender(canvas[idx[first]], bs[first])
+            idx = np.delete(idx, first)
+            bs = np.delete(bs, first)
+    return merge
+
+def _overwrite_merge(canvas, idx, bs):
+    # Overwriting doesn't depend on the canvas, so one assignment does it;
+    # for repeated pixels the last one wins
+    canvas[idx] = bs
+
+# How a layer's pixels (flat canvas indices + brightness) are merged into
+# the LayeredEffect canvas for each BlendMode. MAX and ADD have unbuffered
+# ufunc.at scatter-reductions that apply repeated pixels in order in a
+# single C call; the alpha blends go through the occurrence loop.
+_CANVAS_MERGES = {mode: _pointwise_merge(f) for mode, f in _ARRAY_BLENDERS.items()}
+_CANVAS_MERGES[BlendMode.MAX] = np.maximum.at
+_CANVAS_MERGES[BlendMode.ADD] = np.add.at
+_CANVAS_MERGES[BlendMode.OVERWRITE] = _overwrite_merge
+
 def blend(dst: float, src: float, mode: BlendMode) -> float:
-    if mode == BlendMode.MAX:
-        return max(dst, src)
-    if mode == BlendMode.ADD:
-        return dst + src
-    if mode == BlendMode.ALPHA_SOFT:
-        return dst * 0.75 + src * 0.25
-    if mode == BlendMode.ALPHA_HARD:
-        return dst * 0.4 + src * 0.6
-    return src  # OVERWRITE
+    return _BLENDERS.get(mode, _overwrite)(dst, src)
+
+def blend_arrays(dst: np.ndarray, src: np.ndarray, mode: BlendMode) -> np.ndarray:
+    """Element-wise version of blend() for numpy arrays."""
+    return _ARRAY_BLENDERS.get(mode, _overwrite)(dst, src)
 
 
 class BaseEffect:
@@ -69,6 +181,7 @@ class BaseEffect:
 
     Contract:
         - step() returns a list of (x, y, brightness) tuples
+        - step_arrays() returns the same frame as parallel numpy arrays
         - reset() restores the effect to its initial state
         - is_done() indicates whether the effect has finished
 
@@ -81,6 +194,18 @@ class BaseEffect:
         """Return (x, y, brightness) pixels for this frame."""
         raise NotImplementedError
 
+    def step_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Advance one frame and return its pixels as (xs, ys, bs) arrays.
+
+        xs and ys are int16 coordinates and bs is float64 brightness, in the
+        same order step() would have returned them. Renderers and composites
+        call this instead of step() so they can work on whole frames with
+        numpy. The default converts the output of step(); effects that build
+        their pixels as arrays override it and derive step() from it instead.
+        """
+        return _pixel_arrays(self.step())
+
     def reset(self):
         """Reset internal state so the effect can be replayed."""
         pass
@@ -114,24 +239,50 @@ class LayeredEffect(BaseEffect):
     merged using the layer's blend mode. Finished effects are
     automatically reset, making this suitable for looping visuals.
 
+    Layers are blended into a dense canvas the size of the display, so
+    pixels a layer emits outside of it are dropped.
+
     Args:
         *layers (Layer): One or more Layer objects.
+        width (int | None): Display width (None = use DisplayConfig).
+        height (int | None): Display height (None = use DisplayConfig).
     """
-    def __init__(self, *layers: Layer):
+    def __init__(self, *layers: Layer, width=None, height=None):
+        self.width = width if width is not None else DisplayConfig.width
+        self.height = height if height is not None else DisplayConfig.height
         self.layers = layers
+        # Canvas indexed [x, y], plus which pixels any layer touched this frame
+        self._canvas = np.zeros((self.width, self.height))
+        self._lit = np.zeros((self.width, self.height), dtype=bool)
+        # The layers and their blend modes are fixed, so pick each layer's
+        # canvas merge once here rather than dispatching on it every frame
+        self._merges = [
+            (layer.effect, _CANVAS_MERGES.get(layer.blend, _overwrite_merge))
+            for layer in layers
+        ]
 
     def step(self):
-        pixels: dict[tuple[int, int], float] = {}
+        return _pixel_list(*self.step_arrays())
 
-        for layer in self.layers:
-            if layer.effect.is_done():
-                layer.effect.reset()
+    def step_arrays(self):
+        w, h = self.width, self.height
+        canvas = self._canvas.reshape(-1)
+        lit = self._lit.reshape(-1)
+        canvas.fill(0.0)
+        lit.fill(False)
 
-            for x, y, b in layer.effect.step():
-                key = (x, y)
-                pixels[key] = blend(pixels.get(key, 0.0), b, layer.blend)
+        for effect, merge in self._merges:
+            if effect.is_done():
+                effect.reset()
 
-        return [(x, y, b) for (x, y), b in pixels.items()]
+            xs, ys, bs = effect.step_arrays()
+            inside = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+            idx = xs[inside].astype(np.intp) * h + ys[inside]
+            lit[idx] = True
+            merge(canvas, idx, bs[inside])
+
+        xs, ys = np.nonzero(self._lit)
+        return xs.astype(np.int16), ys.astype(np.int16), self._canvas[xs, ys]
 
     def reset(self):
         for layer in self.layers:
@@ -147,6 +298,13 @@ class Sparkle(BaseEffect):
     If `speed` is None at construction, a random speed will be chosen at reset.
     """
 
+    # sine tables shared between sparkles, keyed by cycle length
+    _luts: dict[int, tuple[float, ...]] = {}
+
+    # random start steps and speeds, shared between sparkles
+    _starts = _RandomInts(0, 50)
+    _speeds = _RandomInts(10, 50)
+
     def __init__(self, x, y, speed: int | None = None):
         """
         Store pixel coordinates and speed, then initialize state via `reset()`.
@@ -163,16 +321,23 @@ class Sparkle(BaseEffect):
         """
         Reset sparkle to start a new cycle. If `speed` was zero, pick a new random speed.
         """
-        self.step_count = randint(0, 50)
-        self.speed = self._fixed_speed or randint(10, 50)
+        self.step_count = self._starts.draw()
+        self.speed = self._fixed_speed or self._speeds.draw()
         self.max_steps = self.speed
         self.brightness = 1
 
+        # brightness for every step of the cycle; the random start can land
+        # past max_steps, so the table always reaches step 50
+        lut = self._luts.get(self.max_steps)
+        if lut is None:
+            n = max(50, self.max_steps) + 1
+            lut = tuple(math.sin(i / self.max_steps * math.pi) for i in range(n))
+            self._luts[self.max_steps] = lut
+        self._lut = lut
+
     def step(self):
         """Advance the sparkle one step and return (x, y, normalized_brightness)."""
-        t = self.step_count / self.max_steps
-
-        brightness = math.sin(t * math.pi)  # smooth in/out
+        brightness = self._lut[self.step_count]  # smooth in/out
 
         self.step_count += 1
 
@@ -346,7 +511,13 @@ class Comet(BaseEffect):
         self.height = height if height is not None else DisplayConfig.height
         self.dx = dx
         self.dy = dy
-        self.tail = collections.deque(maxlen=tail_length)
+        self.tail_length = tail_length
+        # Tail falloff only depends on how many segments are lit, so build the
+        # brightness for every possible length once: row n of _fades holds the
+        # n tail brightnesses in its first n columns.
+        self._fades = np.zeros((tail_length + 1, tail_length))
+        for n in range(1, tail_length + 1):
+            self._fades[n, :n] = [max(0.05, (1.0 - i / n) ** 2) for i in range(n)]
         self.bounce = bounce
         self.start_x = float(x)
         self.start_y = float(y)
@@ -356,10 +527,23 @@ class Comet(BaseEffect):
     def reset(self):
         self.x = self.start_x
         self.y = self.start_y
-        self.tail.clear()
         self.distance = 0.0
+        # Distance covered per step; bouncing only flips the signs of dx/dy,
+        # so this stays the same for the whole run
+        self._step_dist = math.hypot(self.dx, self.dy)
+
+        # Tail positions live in a fixed ring buffer; _head is the slot of
+        # the newest entry and _len how many slots are filled
+        self._tail_x = np.zeros(self.tail_length, np.int16)
+        self._tail_y = np.zeros(self.tail_length, np.int16)
+        self._order = _ring_order(self.tail_length)
+        self._head = -1
+        self._len = 0
 
     def step(self):
+        return _pixel_list(*self.step_arrays())
+
+    def step_arrays(self):
         w, h = self.width, self.height
         nx = self.x + self.dx
         ny = self.y + self.dy
@@ -378,19 +562,54 @@ class Comet(BaseEffect):
             ny %= h
 
         self.x, self.y = nx, ny
-        self.tail.appendleft((int(round(self.x)), int(round(self.y))))
 
-        pixels = []
-        for i, (cx, cy) in enumerate(self.tail):
-            brightness = max(0.05, (1.0 - i / len(self.tail))**2)
-            pixels.append((cx, cy, brightness))
-        self.distance += math.hypot(self.dx, self.dy)
-        return pixels
+        head = (self._head + 1) % self.tail_length
+        self._tail_x[head] = int(round(self.x))
+        self._tail_y[head] = int(round(self.y))
+        self._head = head
+        self._len = n = min(self._len + 1, self.tail_length)
+
+        tail = self._order[head, :n]
+        self.distance += self._step_dist
+        return self._tail_x[tail], self._tail_y[tail], self._fades[n, :n]
 
     def is_done(self):
         # return self.distance > self.max_distance
         return False
 
+def _ripple_kernel(dist, radius, fade, xs, ys, bs):
+    # Collect the wave-front pixels of the [x, y] distance grid into the
+    # preallocated xs/ys/bs buffers and return how many were written.
+    # With numba available this runs as one compiled loop over the grid.
+    n = 0
+    w, h = dist.shape
+    for x in range(w):
+        for y in range(h):
+            # thickness of the wave front
+            delta = abs(dist[x, y] - radius)
+            if delta < 1.0:
+                xs[n] = x
+                ys[n] = y
+                # smooth bell-shaped brightness
+                bs[n] = math.cos(delta * math.pi / 2) * fade
+                n += 1
+    return n
+
+
+if njit is not None:
+    _ripple_kernel = njit(cache=True)(_ripple_kernel)
+else:
+    def _ripple_kernel(dist, radius, fade, xs, ys, bs):
+        # Same as above, computed with numpy
+        delta = np.abs(dist - radius)
+        fx, fy = np.nonzero(delta < 1.0)
+        n = len(fx)
+        xs[:n] = fx
+        ys[:n] = fy
+        bs[:n] = np.cos(delta[fx, fy] * math.pi / 2) * fade
+        return n
+
+
 class WaveRipple(BaseEffect):
     """
     An expanding circular wave that radiates outward from a center point.
@@ -440,24 +659,27 @@ class WaveRipple(BaseEffect):
         else:
             self.max_radius = math.hypot(w, h)
 
-    def step(self):
-        pixels = []
-        w, h = self.width, self.height
+        # Distance from the centre to every pixel, shared between ripples
+        # with the same centre on the same display
+        self._dist = _dist_grid(w, h, self.cx, self.cy)
 
-        for x in range(w):
-            for y in range(h):
-                dist = math.hypot(x - self.cx, y - self.cy)
+        # Scratch buffers _ripple_kernel writes the wave front into
+        self._front_x = np.empty(w * h, dtype=np.int16)
+        self._front_y = np.empty(w * h, dtype=np.int16)
+        self._front_b = np.empty(w * h, dtype=np.float64)
 
-                # thickness of the wave front
-                delta = abs(dist - self.radius)
+    def step(self):
+        return _pixel_list(*self.step_arrays())
 
-                if delta < 1.0:
-                    # smooth bell-shaped brightness
-                    brightness = math.cos(delta * math.pi / 2)
-                    brightness *= max(0.0, 1.0 - round(self.radius) / round(self.max_radius))
+    def step_arrays(self):
+        n = 0
+        fade = max(0.0, 1.0 - round(self.radius) / round(self.max_radius))
 
-                    if brightness > 0:
-                        pixels.append((x, y, brightness))
+        if fade > 0:
+            n = _ripple_kernel(
+                self._dist, self.radius, fade,
+                self._front_x, self._front_y, self._front_b,
+            )
 
         self.radius += self.speed
 
@@ -465,7 +687,7 @@ class WaveRipple(BaseEffect):
         if round(self.radius) > round(self.max_radius):
             self.radius = 0.0
 
-        return pixels
+        return self._front_x[:n].copy(), self._front_y[:n].copy(), self._front_b[:n].copy()
 
     def is_done(self):
         return False
@@ -505,13 +727,14 @@ class ExpandingBox(BaseEffect):
     def step(self):
         pixels = []
         r = self.radius
+        cx, cy = self.cx, self.cy
+        ys = range(self.height)
 
         for x in range(self.width):
-            for y in range(self.height):
-                if (
-                    ((abs(x - self.cx) == r) and (abs(y - self.cy) <= r)) or
-                    ((abs(y - self.cy) == r) and (abs(x - self.cx) <= r))
-                ):
+            ax = abs(x - cx)
+            for y in ys:
+                ay = abs(y - cy)
+                if (ax == r and ay <= r) or (ay == r and ax <= r):
                     pixels.append((x, y, 1.0))
 
         self.radius += self.speed
@@ -551,10 +774,27 @@ class ScannerSweep(BaseEffect):
     def reset(self):
         self.pos = 0
         self.x_direction = 1
-        self.trail = collections.deque(maxlen=self.trail_length)
 
+        # Trail line positions in a fixed ring buffer; _head is the slot of
+        # the newest line and _len how many slots are filled
+        self._lines = np.zeros(self.trail_length, np.int16)
+        self._order = _ring_order(self.trail_length)
+        self._head = -1
+        self._len = 0
+
+        # Brightness of each trail line only depends on its age, and every
+        # line covers the same run of pixels across the sweep direction
+        self._trail_b = np.array([
+            max(0.05, (1.0 - i / self.trail_length) ** 2)
+            for i in range(self.trail_length)
+        ])
+        across = self.height if self.horizontal else self.width
+        self._across = np.arange(across, dtype=np.int16)
 
     def step(self):
+        return _pixel_list(*self.step_arrays())
+
+    def step_arrays(self):
         w, h = self.width, self.height
 
         # move scanner
@@ -571,21 +811,20 @@ class ScannerSweep(BaseEffect):
                 self.pos = 0
                 self.done = True
 
-        self.trail.appendleft(int(self.pos))
+        head = (self._head + 1) % self.trail_length
+        self._lines[head] = int(self.pos)
+        self._head = head
+        self._len = n = min(self._len + 1, self.trail_length)
 
-        pixels = []
+        # One line per trail entry, newest first
+        lines = self._lines[self._order[head, :n]]
+        along = np.repeat(lines, len(self._across))
+        across = np.tile(self._across, n)
+        brightness = np.repeat(self._trail_b[:n], len(self._across))
 
-        for i, p in enumerate(self.trail):
-            brightness = max(0.05, (1.0 - i / self.trail_length) ** 2)
-
-            if self.horizontal:
-                for y in range(h):
-                    pixels.append((p, y, brightness))
-            else:
-                for x in range(w):
-                    pixels.append((x, p, brightness))
-
-        return pixels
+        if self.horizontal:
+            return along, across, brightness
+        return across, along, brightness
 
     def is_done(self):
         return False
@@ -625,12 +864,16 @@ class ZigZagSweep(BaseEffect):
         self.trail = collections.deque(maxlen=self.trail_length)
         self.done = False
 
+        # Trail brightness only depends on the position in the trail
+        self._trail_b = [
+            max(0.05, (1.0 - i / self.trail_length) ** 2)
+            for i in range(self.trail_length)
+        ]
+
     def step(self):
         if self.done:
             return []
 
-        pixels = []
-
         # Move horizontally
         self.col += self.x_direction * self.speed
 
@@ -660,11 +903,7 @@ class ZigZagSweep(BaseEffect):
 
         self.trail.appendleft((self.col, self.row))
 
-        for i, (x, y) in enumerate(self.trail):
-            brightness = max(0.05, (1.0 - i / self.trail_length) ** 2)
-            pixels.append((x, y, brightness))
-
-        return pixels
+        return [(x, y, b) for (x, y), b in zip(self.trail, self._trail_b)]
 
     def is_done(self):
         return self.done
@@ -673,11 +912,12 @@ class BakedAnimation(BaseEffect):
     """
     Plays back a pre-recorded animation from a compressed file.
 
-    Frames are loaded from a gzip-compressed JSON file produced by
-    AnimationRecorder. Can loop or play once.
+    Frames are loaded from a file produced by AnimationRecorder, either
+    the numpy .npz format or the older gzip-compressed JSON (.anim.gz).
+    Can loop or play once.
 
     Args:
-        filename (str): Path to .anim.gz file.
+        filename (str): Path to a .npz or .anim.gz file.
         loop (bool): Whether to restart when finished.
     """
     def __init__(self, filename: str, loop: bool = True):
@@ -686,29 +926,64 @@ class BakedAnimation(BaseEffect):
         self.reset()
 
     def reset(self):
+        if self.filename.endswith(".npz"):
+            # Already stored as the padded arrays used for playback
+            with np.load(self.filename) as data:
+                self._xs = data["xs"]
+                self._ys = data["ys"]
+                self._bs = data["bs"]
+                self._counts = data["counts"]
+        else:
+            self._load_json()
+
+        self.frame_count = len(self._counts)
+        self.index = 0
+        self.done = False
+
+    def _load_json(self):
         import json, gzip
 
         with gzip.open(self.filename, "rt", encoding="utf-8") as f:
             data = json.load(f)
 
-        self.frames = data["frames"]
-        self.index = 0
-        self.done = False
+        # Decode every frame into padded (frame, pixel) arrays once here, so
+        # playback only slices them instead of rebuilding tuples from JSON.
+        frames = data["frames"]
+        count = len(frames)
+        max_pixels = max((len(frame) for frame in frames), default=0)
+
+        self._xs = np.zeros((count, max_pixels), np.int16)
+        self._ys = np.zeros((count, max_pixels), np.int16)
+        self._bs = np.zeros((count, max_pixels), np.float64)
+        self._counts = np.zeros(count, np.int32)
+
+        for i, frame in enumerate(frames):
+            n = len(frame)
+            if n:
+                pixels = np.array(frame, np.float64)
+                self._xs[i, :n] = pixels[:, 0]
+                self._ys[i, :n] = pixels[:, 1]
+                self._bs[i, :n] = pixels[:, 2]
+            self._counts[i] = n
 
     def step(self):
-        if self.done:
-            return []
+        return _pixel_list(*self.step_arrays())
+
+    def step_arrays(self):
+        if self.done or not self.frame_count:
+            return _pixel_arrays([])
 
-        frame = self.frames[self.index]
+        i = self.index
+        n = self._counts[i]
         self.index += 1
 
-        if self.index >= len(self.frames):
+        if self.index >= self.frame_count:
             if self.loop:
                 self.index = 0
             else:
                 self.done = True
 
-        return frame
+        return self._xs[i, :n], self._ys[i, :n], self._bs[i, :n]
 
     def is_done(self):
         return self.done
@@ -733,9 +1008,13 @@ class PulseFade(BaseEffect):
 
     def reset(self):
         self.phase = 0.0
+        # Every pixel gets the same brightness, so the coordinates are fixed
+        xs, ys = np.meshgrid(np.arange(self.width), np.arange(self.height), indexing="ij")
+        self._xs = xs.ravel().astype(np.int16)
+        self._ys = ys.ravel().astype(np.int16)
+        self._coords = list(zip(self._xs.tolist(), self._ys.tolist()))
 
-
-    def step(self):
+    def _advance(self):
         brightness = (math.sin(self.phase) + 1.0) / 2.0
         self.phase += self.speed
 
@@ -745,12 +1024,15 @@ class PulseFade(BaseEffect):
             else:
                 self.done = True
 
-        pixels = []
-        for x in range(self.width):
-            for y in range(self.height):
-                pixels.append((x, y, brightness))
+        return brightness
 
-        return pixels
+    def step(self):
+        brightness = self._advance()
+        return [(x, y, brightness) for x, y in self._coords]
+
+    def step_arrays(self):
+        brightness = self._advance()
+        return self._xs, self._ys, np.full(len(self._xs), brightness)
 
     def is_done(self):
         return False
@@ -942,14 +1224,16 @@ class TextScroller(BaseEffect):
             return []
 
         visible_pixels = []
+        x_start, y_pos, offset = self.x_start, self.y_pos, self.scroll_offset
+        w, h = self.width, self.height
 
         for px, py, brightness in self.text_pixels:
             # Apply scroll transformation and starting position
-            display_x = int(self.x_start + px - self.scroll_offset)
-            display_y = self.y_pos + py
+            display_x = int(x_start + px - offset)
+            display_y = y_pos + py
 
             # Only include pixels within the viewport
-            if 0 <= display_x < self.width and 0 <= display_y < self.height:
+            if 0 <= display_x < w and 0 <= display_y < h:
                 visible_pixels.append((display_x, display_y, brightness))
 
         # Update scroll position
@@ -1044,37 +1328,38 @@ class PacMan(BaseEffect):
         dir_angle = math.atan2(self.dy, self.dx)
 
         pixels = []
-
-        # Tight bounding box (reduces flicker)
-        xmin = int(self.x - self.radius - 1)
-        xmax = int(self.x + self.radius + 1)
-        ymin = int(self.y - self.radius - 1)
-        ymax = int(self.y + self.radius + 1)
-
-        for ix in range(xmin, xmax + 1):
-            for iy in range(ymin, ymax + 1):
-                if not (0 <= ix < w and 0 <= iy < h):
-                    continue
-
+        # Locals for the per-pixel loop
+        hypot, atan2, pi = math.hypot, math.atan2, math.pi
+        px, py, radius = self.x, self.y, self.radius
+
+        # Tight bounding box (reduces flicker), limited to the display
+        xmin = int(px - radius - 1)
+        xmax = int(px + radius + 1)
+        ymin = int(py - radius - 1)
+        ymax = int(py + radius + 1)
+        rows = range(max(ymin, 0), min(ymax, h - 1) + 1)
+
+        for ix in range(max(xmin, 0), min(xmax, w - 1) + 1):
+            for iy in rows:
                 # Sample at pixel center
-                dx = ix + 0.5 - self.x
-                dy = iy + 0.5 - self.y
-                dist = math.hypot(dx, dy)
+                dx = ix + 0.5 - px
+                dy = iy + 0.5 - py
+                dist = hypot(dx, dy)
 
                 # Solid filled body
-                if dist > self.radius:
+                if dist > radius:
                     continue
 
-                angle = math.atan2(dy, dx)
+                angle = atan2(dy, dx)
 
                 # Relative angle to direction
-                rel = (angle - dir_angle + math.pi * 3) % (2 * math.pi) - math.pi
+                rel = (angle - dir_angle + pi * 3) % (2 * pi) - pi
 
                 # Mouth cutout (hard, stable)
                 if abs(rel) < mouth_angle:
                     continue
 
-                b = self.radius - dist + 0.6   # may go >1 or <0
+                b = radius - dist + 0.6   # may go >1 or <0
                 pixels.append((ix, iy, b))
 
         return pixels
@@ -400,9 +400,9 @@ def example_bake_animation():
     # Record it
     recorder = AnimationRecorder(effect, fps=25)
     recorder.record(frames=150)
-    recorder.save("demo_animation.anim.gz")
+    recorder.save("demo_animation.npz")
 
-    print("  Animation saved to demo_animation.anim.gz")
+    print("  Animation saved to demo_animation.npz")
 
 
 def example_play_baked_animation():
@@ -410,7 +410,7 @@ def example_play_baked_animation():
     print("Example 30: Play Baked Animation")
 
     # Load and play the animation
-    animation = BakedAnimation("demo_animation.anim.gz", loop=False)
+    animation = BakedAnimation("demo_animation.npz", loop=False)
 
     runner = EffectRunner(animation, fps=25)
     runner.run(frames=150)
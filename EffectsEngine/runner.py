@@ -3,6 +3,9 @@
 import time
 import json
 import gzip
+import queue
+import threading
+import numpy as np
 import scrollphathd
 
 ###------------------------------------------------------------------------------###
@@ -60,11 +63,14 @@ class EffectRunner:
         effect (BaseEffect): Effect to run.
         fps (float): Frames per second.
         invert (bool): Whether to invert brightness values.
+        threaded (bool): Compute the next frame on a background thread
+            while the current one is sent to the display.
     """
-    def __init__(self, effect, fps: float = 20, invert: bool = False):
+    def __init__(self, effect, fps: float = 20, invert: bool = False, threaded: bool = False):
         self.effect = effect
         self.delay = 1.0 / fps
         self.invert = invert
+        self.threaded = threaded
 
     def apply_transformation(self, b:float) -> float:
         if self.invert:
@@ -72,23 +78,116 @@ class EffectRunner:
         return b
 
     def run(self, frames: int | None = None):
+        w, h = scrollphathd.width, scrollphathd.height
+
+        if self.threaded:
+            source = self._frames_threaded(frames, w, h)
+        else:
+            source = self._frames(frames, w, h)
+
+        # Clear once up front. Frames are written into the copy of the buffer
+        # that show() hands to before_display, so the buffer itself stays
+        # blank and doesn't need clearing again every frame.
+        scrollphathd.clear()
+
+        # Frames are paced against a monotonic deadline, so the time spent in
+        # step()/show() comes out of the frame delay instead of adding to it
+        deadline = time.monotonic()
+
+        try:
+            for frame in source:
+                self._display(frame)
+
+                deadline += self.delay
+                sleep_for = deadline - time.monotonic()
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+                elif sleep_for < -self.delay:
+                    # More than a frame behind: restart the schedule rather
+                    # than rushing through frames to catch up
+                    deadline = time.monotonic()
+        finally:
+            source.close()
+
+    def _render(self, frame):
+        """Advance the effect one step and write its display levels into frame."""
+        w, h = frame.shape
+        xs, ys, bs = self.effect.step_arrays()
+
+        # Scatter the pixels into a dense [x, y] frame, dropping any that
+        # fall outside the display. Later duplicates win, as before.
+        visible = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+        frame.fill(0.0)
+        frame[xs[visible], ys[visible]] = bs[visible]
+
+        # Invert and clamp the whole frame in one go (same as clamp01 per
+        # pixel); apply_transformation works on arrays as well as floats
+        np.minimum(np.abs(self.apply_transformation(frame)), 1.0, out=frame)
+
+    def _display(self, frame):
+        """Show frame by copying it over the whole display in one assignment."""
+        def paint(buffer):
+            w = min(buffer.shape[0], frame.shape[0])
+            h = min(buffer.shape[1], frame.shape[1])
+            buffer[:w, :h] = frame[:w, :h]
+            return buffer
+
+        scrollphathd.show(before_display=paint)
+
+    def _frames(self, frames, w, h):
+        """Render frames one at a time, reusing a single buffer."""
+        frame = np.zeros((w, h))
         count = 0
 
         while frames is None or count < frames:
-            frame_pixels = {(x, y): b for x, y, b in self.effect.step()}
+            self._render(frame)
+            yield frame
+            count += 1
 
-            scrollphathd.clear()
+    def _frames_threaded(self, frames, w, h):
+        """
+        Render frames on a producer thread into two alternating buffers.
 
-            for x in range(scrollphathd.width):
-                for y in range(scrollphathd.height):
-                    b = frame_pixels.get((x, y), 0.0)
-                    b = self.apply_transformation(b)
-                    b = clamp01(b)
-                    scrollphathd.set_pixel(x, y, b)
+        While one buffer is being shown the other is filled with the next
+        frame; buffers go back to the producer once they have been shown.
+        """
+        free = queue.Queue()
+        ready = queue.Queue()
+        for _ in range(2):
+            free.put(np.zeros((w, h)))
+        stop = threading.Event()
 
-            scrollphathd.show()
-            time.sleep(self.delay)
-            count += 1
+        def produce():
+            count = 0
+            while not stop.is_set() and (frames is None or count < frames):
+                try:
+                    frame = free.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                try:
+                    self._render(frame)
+                except BaseException as e:
+                    ready.put(e)
+                    return
+                ready.put(frame)
+                count += 1
+            ready.put(None)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        try:
+            while True:
+                frame = ready.get()
+                if frame is None:
+                    return
+                if isinstance(frame, BaseException):
+                    raise frame
+                yield frame
+                free.put(frame)
+        finally:
+            stop.set()
+            producer.join()
 
 ###-------------------------------------------------------------------------------###
 # AnimationRecorder a replacement for the EffectRunner Class that saves frames to a file to be read from later.
@@ -107,7 +206,8 @@ class AnimationRecorder:
     def __init__(self, effect, fps: float = 25):
         self.effect = effect
         self.fps = fps
-        self.frames: list[list[tuple[int, int, float]]] = []
+        # One (xs, ys, bs) array triple per frame, as returned by step_arrays()
+        self.frames: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
 
     def record(self, frames: int | None = None):
         """
@@ -121,7 +221,8 @@ class AnimationRecorder:
         count = 0
 
         while frames is None or count < frames:
-            frame = self.effect.step()
+            # Copy, since effects may hand out views of their own buffers
+            frame = tuple(a.copy() for a in self.effect.step_arrays())
             self.frames.append(frame)
 
             count += 1
@@ -129,16 +230,63 @@ class AnimationRecorder:
                 break
 
     def save(self, filename: str):
+        """
+        Save the recorded frames.
+
+        Filenames ending in .npz are written as compressed numpy arrays
+        (padded per-frame xs/ys/bs plus pixel counts) that BakedAnimation
+        loads without any parsing. Any other filename uses the original
+        gzip-compressed JSON format.
+        """
+        if filename.endswith(".npz"):
+            self._save_npz(filename)
+        else:
+            self._save_json(filename)
+
+        print(f"Saved animation: {filename} ({len(self.frames)} frames)")
+
+    def _save_npz(self, filename: str):
+        count = len(self.frames)
+        max_pixels = max((len(xs) for xs, _, _ in self.frames), default=0)
+
+        xs = np.zeros((count, max_pixels), np.int16)
+        ys = np.zeros((count, max_pixels), np.int16)
+        bs = np.zeros((count, max_pixels), np.float64)
+        counts = np.zeros(count, np.int32)
+
+        for i, (fx, fy, fb) in enumerate(self.frames):
+            n = len(fx)
+            xs[i, :n] = fx
+            ys[i, :n] = fy
+            bs[i, :n] = fb
+            counts[i] = n
+
+        # Write through a file object so numpy doesn't append its own suffix
+        with open(filename, "wb") as f:
+            np.savez_compressed(
+                f,
+                version=2,
+                width=scrollphathd.width,
+                height=scrollphathd.height,
+                fps=self.fps,
+                xs=xs,
+                ys=ys,
+                bs=bs,
+                counts=counts,
+            )
+
+    def _save_json(self, filename: str):
         data = {
             "version": 1,
             "width": scrollphathd.width,
             "height": scrollphathd.height,
             "fps": self.fps,
             "frame_count": len(self.frames),
-            "frames": self.frames,
+            "frames": [
+                list(zip(xs.tolist(), ys.tolist(), bs.tolist()))
+                for xs, ys, bs in self.frames
+            ],
         }
 
         with gzip.open(filename, "wt", encoding="utf-8") as f:
             json.dump(data, f)
-
-        print(f"Saved animation: {filename} ({len(self.frames)} frames)")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Round-trip tests for AnimationRecorder and BakedAnimation (no hardware required).
+
+Records a short effect, saves it in both the .npz and the gzip JSON
+format, loads each back with BakedAnimation and checks the frames match
+what was recorded.
+"""
+
+import os
+import tempfile
+
+from effects import BakedAnimation, SparkleField, Comet, Layer, LayeredEffect, BlendMode
+from runner import AnimationRecorder
+
+
+def record_frames(count=40):
+    """Record a layered effect whose pixel count changes from frame to frame."""
+    scene = LayeredEffect(
+        Layer(SparkleField(density=20), BlendMode.MAX),
+        Layer(Comet(0, 0, dx=1, dy=0.5, tail_length=6), BlendMode.ADD)
+    )
+    recorder = AnimationRecorder(scene, fps=25)
+    recorder.record(frames=count)
+
+    expected = [
+        list(zip(xs.tolist(), ys.tolist(), bs.tolist()))
+        for xs, ys, bs in recorder.frames
+    ]
+    return recorder, expected
+
+
+def check_round_trip(suffix):
+    recorder, expected = record_frames()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "test" + suffix)
+        recorder.save(filename)
+
+        anim = BakedAnimation(filename, loop=False)
+        assert anim.frame_count == len(expected), "Frame count should survive the round trip"
+
+        for i, frame in enumerate(expected):
+            assert not anim.is_done(), f"Playback ended early at frame {i}"
+            assert anim.step() == frame, f"Frame {i} differs after loading {suffix}"
+
+        assert anim.is_done(), "Playback should finish after the last frame"
+
+    print(f"[OK] {len(expected)} frames match after saving as {suffix}")
+
+
+def test_npz_round_trip():
+    """Test 1: Frames saved as .npz load back unchanged."""
+    print("\n=== Test 1: .npz Round Trip ===")
+    check_round_trip(".npz")
+
+
+def test_json_round_trip():
+    """Test 2: Frames saved as gzip JSON load back unchanged."""
+    print("\n=== Test 2: gzip JSON Round Trip ===")
+    check_round_trip(".anim.gz")
+
+
+def test_formats_agree():
+    """Test 3: Both formats play back the same frames."""
+    print("\n=== Test 3: Formats Agree ===")
+
+    recorder, expected = record_frames()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        played = []
+        for suffix in (".npz", ".anim.gz"):
+            filename = os.path.join(tmp, "test" + suffix)
+            recorder.save(filename)
+
+            anim = BakedAnimation(filename, loop=False)
+            played.append([anim.step() for _ in range(anim.frame_count)])
+
+    assert played[0] == played[1] == expected, ".npz and gzip JSON playback should match"
+
+    print("[OK] .npz and gzip JSON play back identical frames")
+
+
+def run_all_tests():
+    """Run all tests sequentially."""
+    print("=" * 60)
+    print("Baked Animation Round-Trip Tests (No Hardware Required)")
+    print("=" * 60)
+
+    try:
+        test_npz_round_trip()
+        test_json_round_trip()
+        test_formats_agree()
+
+        print("\n" + "=" * 60)
+        print("[OK] ALL TESTS PASSED!")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n[FAIL] TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    except Exception as e:
+        print(f"\n[FAIL] UNEXPECTED ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
@@ -3,8 +3,15 @@
 import time
 import math
 
+import numpy
+
 import scrollphathd
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 print("""
 Scroll pHAT HD: Plasma
 
@@ -14,17 +21,44 @@ Press Ctrl+C to exit!
 
 """)
 
+
+def draw_plasma(buf, s, phase):
+    # Fill buf[x][y] with the plasma pattern for this frame.
+    # With numba available this loop is compiled once (and cached on disk)
+    # for the fixed float32 buffer, so the sin/cos work runs as machine code.
+    width, height = buf.shape
+    for x in range(width):
+        sx = math.sin((x * s) + phase)
+        for y in range(height):
+            buf[x, y] = 0.3 + (0.3 * sx * math.cos((y * s) + phase))
+
+
+if njit is not None:
+    draw_plasma = njit('void(float32[:,::1], float32, float32)', cache=True, fastmath=True)(draw_plasma)
+else:
+    def draw_plasma(buf, s, phase):
+        # Same pattern as above, computed with numpy broadcasting instead
+        width, height = buf.shape
+        sx = numpy.sin(numpy.arange(width) * s + phase)
+        cy = numpy.cos(numpy.arange(height) * s + phase)
+        buf[:] = 0.3 + 0.3 * numpy.outer(sx, cy)
+
+
+plasma = numpy.zeros((scrollphathd.DISPLAY_WIDTH, scrollphathd.DISPLAY_HEIGHT), dtype=numpy.float32)
+
+
+def paint(buf):
+    numpy.copyto(buf, plasma)
+    return buf
+
+
 i = 0
 
 while True:
     i += 2
     s = math.sin(i / 50.0) * 2.0 + 6.0
 
-    for x in range(0, 17):
-        for y in range(0, 7):
-            v = 0.3 + (0.3 * math.sin((x * s) + i / 4.0) * math.cos((y * s) + i / 4.0))
-
-            scrollphathd.pixel(x, y, v)
+    draw_plasma(plasma, s, i / 4.0)
 
     time.sleep(0.01)
-    scrollphathd.show()
+    scrollphathd.show(before_display=paint)
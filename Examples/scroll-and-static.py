@@ -32,15 +32,14 @@ def draw_static_elements(buf):
     # our scrolling text twice a second.
 
     if int(time.time() * 2) % 2 == 0:
-        for x in range(scrollphathd.DISPLAY_WIDTH):
-            if x % 2 == 0:
-                buf[x][0] = 1.0
-                buf[x][scrollphathd.DISPLAY_HEIGHT - 1] = 1.0
-
-        for y in range(scrollphathd.DISPLAY_HEIGHT):
-            if y % 2 == 0:
-                buf[0][y] = 1.0
-                buf[scrollphathd.DISPLAY_WIDTH - 1][y] = 1.0
+        width = scrollphathd.DISPLAY_WIDTH
+        height = scrollphathd.DISPLAY_HEIGHT
+
+        # Every other pixel along each edge, as four strided slice writes
+        buf[0:width:2, 0] = 1.0
+        buf[0:width:2, height - 1] = 1.0
+        buf[0, 0:height:2] = 1.0
+        buf[width - 1, 0:height:2] = 1.0
 
     return buf
 
@@ -7,9 +7,6 @@ import time
 # for ease of making nested for loops to represent the 2D Led matrix
 import itertools
 
-# different data structures
-import collections
-
 from random import shuffle, randint
 
 # for handling array operations
@@ -18,11 +15,46 @@ import numpy as np
 # for controlling the led matrix
 import scrollphathd
 
+# optional JIT compilation for the numeric kernels, falls back to plain python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for `numba.njit` that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # Uncomment the below if your display is upside down
 # (e.g. if you're using it in a Pimoroni Scroll Bot)
 scrollphathd.rotate(degrees=180)
 scrollphathd.set_brightness(0.8)
 
+# number of pixels the progressive fill animations light between display refreshes.
+# every show() pushes the whole matrix over I2C, so refreshing per pixel is wasteful.
+FILL_BATCH = 8
+
+# checkerboard frame, lit at 0.8 where (col + row) is even. Built once at import
+# so `checker_fill_light` can copy it straight into the display buffer.
+CHECKER = np.fromfunction(
+    lambda x, y: ((x + y) % 2 == 0) * 0.8,
+    (scrollphathd.width, scrollphathd.height),
+    dtype=np.float32,
+)
+
+# pixel orders for the progressive fills as (N, 2) arrays of (col, row), built
+# once at import instead of on every call
+COLUMN_ORDER = np.array(
+    list(itertools.product(range(scrollphathd.width), range(scrollphathd.height))),
+    dtype=np.int16,
+)
+ROW_ORDER = COLUMN_ORDER.reshape(scrollphathd.width, scrollphathd.height, 2) \
+    .transpose(1, 0, 2).reshape(-1, 2)
+# serpentine: same as ROW_ORDER but every odd row runs right to left
+ZIGZAG_ORDER = ROW_ORDER.reshape(scrollphathd.height, scrollphathd.width, 2).copy()
+ZIGZAG_ORDER[1::2] = ZIGZAG_ORDER[1::2, ::-1]
+ZIGZAG_ORDER = ZIGZAG_ORDER.reshape(-1, 2)
+
 class Sparkle:
     """
     Represents one pixel that brightens then fades at a fixed or random speed.
@@ -49,10 +81,10 @@ class Sparkle:
         Advance the sparkle one step and return (x, y, normalized_brightness).
         Behavior mirrors `Sparkle.step()`.
         """
-        if self.brightness >= self.speed:
+        # rising until the peak, then falling until dark, then stopped
+        if self.direction > 0 and self.brightness >= self.speed:
             self.direction = -1
-
-        if self.brightness <= 0:
+        elif self.direction < 0 and self.brightness <= 0:
             self.direction = 0
 
         self.brightness += self.direction
@@ -73,6 +105,15 @@ class Sparkle:
         self.direction = 1
         self.speed = self._fixed_speed if self._fixed_speed is not None else randint(2, 50)
 
+@njit(cache=True)
+def _fade(n, out):
+    """
+    Fill `out` with the quadratic falloff for a tail of `n` lit pixels.
+    Index 0 is the comet head (1.0), older pixels dim towards a floor of 0.05.
+    """
+    for i in range(n):
+        out[i] = max(0.05, 1.0 - (i / n) ** 2)
+
 class Comet:
     """A Comet moves across the matrix and leaves a tail whose pixels fade out progressively.
     
@@ -92,52 +133,72 @@ class Comet:
         self.start_y = y
         self.dx = dx
         self.dy = dy
-        self.tail = collections.deque(maxlen=tail_length)
+        self.tail_length = tail_length
         self.bounce = bounce
         self._has_left_start = False
         self._bounces = 0
 
+        # display size is fixed, look it up once rather than on every step
+        self._w, self._h = scrollphathd.width, scrollphathd.height
+
+        # tail is a ring buffer of positions, newest entry lives at self._head
+        self._tx = np.zeros(tail_length, dtype=np.int16)
+        self._ty = np.zeros(tail_length, dtype=np.int16)
+        self._head = 0
+        self._len = 0
+        # _order[head] lists ring slots from `head` onwards, i.e. newest to oldest
+        self._order = (np.arange(tail_length)[:, None] + np.arange(tail_length)) % tail_length
+
+        # the falloff only depends on how many tail pixels are lit, so build
+        # one table per length up front instead of recomputing it every frame
+        self._fades = []
+        for n in range(1, tail_length + 1):
+            fade = np.empty(n, dtype=np.float32)
+            _fade(n, fade)
+            self._fades.append(fade)
+
 
     def step(self):
+        """
+        Advance the comet one step.
+
+        Returns:
+            (xs, ys, brightness) numpy arrays ordered from the head to the tail end.
+        """
         # advance head
         # compute new x,y position based off current x,yposition and velocity
         nx = self.x + self.dx
         ny = self.y + self.dy
 
-        w, h = scrollphathd.width, scrollphathd.height
+        w, h = self._w, self._h
 
         # handle bouncing or wrapping
         if self.bounce:
-            if nx < 0 or nx >= w:
-                self.dx *= -1
-                nx = self.x + self.dx
-            if ny < 0 or ny >= h:
-                self.dy *= -1
-                ny = self.y + self.dy
-                self._bounces += 1
+            # reflect without branching: a step that would leave the display
+            # flips the sign of that velocity component (bools act as 0/1)
+            flip_x = (nx < 0) | (nx >= w)
+            flip_y = (ny < 0) | (ny >= h)
+            self.dx *= 1 - 2 * flip_x
+            self.dy *= 1 - 2 * flip_y
+            nx = self.x + self.dx
+            ny = self.y + self.dy
+            self._bounces += flip_y
         else:
             nx %= w
             ny %= h
 
         # update position
         self.x, self.y = nx, ny
-        # add current position to tail
-        self.tail.appendleft((self.x, self.y))
 
-        # produce list of (x, y, brightness) with falloff
-        pix_list = []
+        # add current position to the front of the tail ring
+        self._head = (self._head - 1) % self.tail_length
+        self._tx[self._head] = self.x
+        self._ty[self._head] = self.y
+        self._len = min(self._len + 1, self.tail_length)
 
-        # iterate over tail positions and assign brightness based on position in tail
-        for i, (cx, cy) in enumerate(self.tail):
-
-            # brightness falls off linearly from 1.0 to 0.05
-            # brightness = max(0.05, 1.0 - (i / len(self.tail)))
-
-            # Alternative: exponential falloff
-            brightness = max(0.05, (1.0 - (i / len(self.tail)) ** 2))
-                             
-            pix_list.append((cx, cy, brightness))
-        return pix_list
+        # gather the lit part of the tail, head first
+        idx = self._order[self._head, :self._len]
+        return self._tx[idx], self._ty[idx], self._fades[self._len - 1]
     
     def is_done(self):
         if not self._has_left_start:
@@ -149,16 +210,51 @@ class Comet:
 
         return self._bounces >= 20
 
+def sleep_until(deadline):
+    """
+    Sleep until `deadline`, a `time.monotonic()` timestamp, and return the time
+    to schedule the next frame from. Scheduling from the deadline rather than
+    from when `show()` returned keeps the frame rate from drifting; if we are
+    already late the schedule is re-anchored to now so frames don't bunch up.
+    """
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+        return deadline
+    return time.monotonic()
+
+def show_frame(frame):
+    """
+    Display `frame`, a (width, height) array of brightness values, by copying it
+    into the display buffer in one write from the `before_display` hook.
+    """
+    def paint(buf):
+        np.copyto(buf, frame)
+        return buf
+
+    scrollphathd.show(before_display=paint)
+
+def show_pixels(xs, ys, bs):
+    """
+    Display only the given pixels, everything else off. `xs`, `ys` and `bs` may be
+    scalars or equal length arrays; they are written with one fancy-indexed
+    assignment instead of a `set_pixel` call per pixel.
+    """
+    def paint(buf):
+        # reset and repaint the same buffer in one pass, no separate clear()
+        buf.fill(0)
+        buf[xs, ys] = bs
+        return buf
+
+    scrollphathd.show(before_display=paint)
+
 def comet_light(repeat=0):
 
     comet = Comet(0, 0, dx=1, dy=1, tail_length=6, bounce=True)
 
     run_count = 0
     while run_count <= repeat:
-        scrollphathd.clear()
-        for x, y, b in comet.step():
-            scrollphathd.set_pixel(x, y, b)
-        scrollphathd.show()
+        show_pixels(*comet.step())
         if repeat > 0:
             run_count += 1
         if comet.is_done():
@@ -199,58 +295,59 @@ def scan_trail_light(repeat=0):
     Behavior:
       - Leading pixel is full brightness (1.0).
       - A trailing set of pixels is lit at decreasing brightness controlled by `trail_length`.
-      - Calls `scrollphathd.show()` and sleeps briefly between steps.
+      - Calls `scrollphathd.show()` every 0.05s, paced against a monotonic deadline.
       - Runs forever and updates the physical display.
     """
     trail_length = 4
     brightness_step = 1.0 / trail_length
-    
-    run_count = 0
-    while run_count <= repeat:
-        for col in range(scrollphathd.width):
-            for row in range(scrollphathd.height):
-                # light up the leading pixel
-                scrollphathd.set_pixel(col, row, 1.0)
-
-                # light up the trailing pixels with decreasing brightness
-                for t in range(1, trail_length + 1):
-                    if row - t >= 0:
-                        scrollphathd.set_pixel(col, row - t, max(0.1, 1.0 - (brightness_step * t)))
-
-                scrollphathd.show()
-                time.sleep(0.05)
-            scrollphathd.clear()
-        if repeat > 0:
-            run_count += 1
+    frame_time = 0.05
+    w, h = scrollphathd.width, scrollphathd.height
+    frame = np.zeros((w, h), dtype=np.float32)
+
+    # brightness from the oldest trail pixel up to the leading pixel (1.0), built
+    # once so each step is a single slice write into the current column
+    trail = np.maximum(0.1, 1.0 - brightness_step * np.arange(trail_length, -1, -1))
+    trail[-1] = 1.0
+
+    runs = range(repeat + 1) if repeat > 0 else itertools.count()
+
+    next_tick = time.monotonic()
+    for _ in runs:
+        for col in range(w):
+            for row in range(h):
+                # light up the leading pixel and the trail above it
+                n = min(row, trail_length)
+                frame[col, row - n:row + 1] = trail[trail_length - n:]
+
+                show_frame(frame)
+                next_tick = sleep_until(next_tick + frame_time)
+            frame.fill(0)
 
 def sparkle_scan_light(repeat=0):
     """
     Run a single `Sparkle` at a time, scanning the display column by column,
     top-to-bottom. Each active sparkle brightens and then dims in place.
+
+    Only one sparkle is ever lit, so a single `Sparkle` is moved along
+    `COLUMN_ORDER` and reset, rather than building one object per pixel.
     """
-    # create a list of Sparkle objects, one per pixel
-    pixels = itertools.product(
-        range(scrollphathd.width), range(scrollphathd.height)
-    )
     sparkle_speed = 50
-    sparkles = [Sparkle(x, y, sparkle_speed) for x, y in pixels]
+    pool_head = 0
+    sparkle = Sparkle(*COLUMN_ORDER[pool_head].tolist(), sparkle_speed)
 
-    active = []
+    frame = np.zeros((scrollphathd.width, scrollphathd.height), dtype=np.float32)
     run_count = 0
     while run_count <= repeat:
-        # keep one active sparkle at a time
-        if len(active) < 1:
-            active.append(sparkles.pop(0))
-
-        for sparkle in active:
-            scrollphathd.set_pixel(*sparkle.step())
-
-            if sparkle.is_done():
-                active.remove(sparkle)
-                sparkle.reset()
-                # append back to pool
-                sparkles.insert(len(sparkles), sparkle)
-        scrollphathd.show()
+        x, y, b = sparkle.step()
+        frame[x, y] = b
+
+        # once it has faded out, move on to the next pixel in scan order
+        if sparkle.is_done():
+            pool_head = (pool_head + 1) % len(COLUMN_ORDER)
+            sparkle.x, sparkle.y = COLUMN_ORDER[pool_head].tolist()
+            sparkle.reset()
+
+        show_frame(frame)
         if repeat > 0:
             run_count += 1
 
@@ -258,32 +355,54 @@ def sparkle_fill_light(repeat=0):
     """
     Fill the matrix with sparkles by randomly selecting up to 100 active sparkles.
     Each sparkle can have a fixed or randomized speed (here fixed).
+
+    Sparkle state is kept as parallel numpy arrays, one slot per pixel, and all
+    active sparkles are stepped together with the same rules as `Sparkle.step()`.
     """
-    pixels = itertools.product(
-        range(scrollphathd.width), range(scrollphathd.height)
-    )
+    w, h = scrollphathd.width, scrollphathd.height
+    n = w * h
+
+    # one slot per pixel, in column-major order
+    xs, ys = COLUMN_ORDER[:, 0], COLUMN_ORDER[:, 1]
 
     # Fixed speed for all sparkles
     sparkle_speed = 50
-    sparkles = [Sparkle(x, y, sparkle_speed) for x, y in pixels]
+    speed = np.full(n, sparkle_speed, dtype=np.int16)
+    brightness = np.ones(n, dtype=np.int16)
+    direction = np.ones(n, dtype=np.int16)
+    active = np.zeros(n, dtype=bool)
+    active_count = 0
+
+    # idle slots, shuffled once up front and taken from the end
+    idle = list(range(n))
+    shuffle(idle)
+
+    frame = np.zeros((w, h), dtype=np.float32)
 
-    active = []
     run_count = 0
     while run_count <= repeat:
-        shuffle(sparkles)
-
         # maintain up to 100 active sparkles
-        if len(active) < 100:
-            active.append(sparkles.pop(0))
-
-        for sparkle in active:
-            scrollphathd.set_pixel(*sparkle.step())
-
-            if sparkle.is_done():
-                active.remove(sparkle)
-                sparkle.reset()
-                sparkles.insert(randint(0, len(sparkles)), sparkle)
-        scrollphathd.show()
+        if active_count < 100 and idle:
+            active[idle.pop()] = True
+            active_count += 1
+
+        # brighten until the peak, then fade back down
+        direction[active & (brightness >= speed)] = -1
+        brightness[active] += direction[active]
+        frame[xs[active], ys[active]] = brightness[active] / speed[active]
+
+        # finished sparkles are reset and returned to a random spot in the pool
+        done = np.flatnonzero(active & (brightness == 0))
+        for i in done.tolist():
+            idle.append(i)
+            j = randint(0, len(idle) - 1)
+            idle[j], idle[-1] = idle[-1], idle[j]
+        brightness[done] = 1
+        direction[done] = 1
+        active[done] = False
+        active_count -= len(done)
+
+        show_frame(frame)
         if repeat > 0:
             run_count += 1
 
@@ -291,40 +410,44 @@ def checker_fill_light(repeat=0):
     """
     Fill the matrix with a checkerboard pattern: pixels where (col+row) % 2 == 0
     are lit at 0.8 brightness. Repeats indefinitely.
-    """
-    pixels = itertools.product(
-        range(scrollphathd.width), range(scrollphathd.height)
-    )
-    pix_list = list(pixels)
 
+    The precomputed `CHECKER` frame is copied into the display buffer in a single
+    write from the `before_display` hook rather than one `set_pixel` per pixel.
+    """
     run_count = 0
     while run_count <= repeat:
-        scrollphathd.clear()
-        for col, row in pix_list:
-            if (col + row) % 2 == 0:
-                scrollphathd.set_pixel(col, row, .8)
-        scrollphathd.show()
+        show_frame(CHECKER)
         if repeat > 0:
             run_count += 1
 
+def fill_in_order(order, brightness=.8):
+    """
+    Light each (col, row) of the (N, 2) array `order` on an initially blank frame.
+    The display is refreshed once every `FILL_BATCH` pixels (and once more for any
+    remainder).
+
+    The order is converted to flat buffer offsets up front, so every batch is a
+    single slice of that index array scattered into the raveled frame.
+    """
+    frame = np.zeros((scrollphathd.width, scrollphathd.height), dtype=np.float32)
+    flat_frame = frame.reshape(-1)
+    flat_order = np.ravel_multi_index((order[:, 0], order[:, 1]), frame.shape)
+    for start in range(0, len(flat_order), FILL_BATCH):
+        flat_frame[flat_order[start:start + FILL_BATCH]] = brightness
+        show_frame(frame)
+
 def random_fill_light(repeat=0):
     """
     Light every LED in a random order each iteration. After the board is filled,
     the order is reshuffled and the process repeats.
     """
-    pixels = itertools.product(
-        range(scrollphathd.width), range(scrollphathd.height)
-    )
-
-    pix_list = list(pixels)
+    order = COLUMN_ORDER.copy()
 
     run_count = 0
     while run_count <= repeat:
-        scrollphathd.clear()
-        shuffle(pix_list)
-        for col, row in pix_list:
-            scrollphathd.set_pixel(col, row, .8)
-            scrollphathd.show()
+        # shuffles the rows of the (N, 2) array in place
+        np.random.shuffle(order)
+        fill_in_order(order)
         if repeat > 0:
             run_count += 1
 
@@ -335,26 +458,29 @@ def row_zigzag_fill_light(repeat=0):
     """
     run_count = 0
     while run_count <= repeat:
-        scrollphathd.clear()
-        direction = 1  # 1 for left to right, -1 for right to left
-
-        for row in range(scrollphathd.height):
-            if direction == 1:
-                for col in range(scrollphathd.width):
-                    scrollphathd.set_pixel(col, row, .8)
-                    scrollphathd.show()
-                    if col == scrollphathd.width - 1:
-                        direction = -1
-            else:
-                for col in reversed(range(scrollphathd.width)):
-                    scrollphathd.set_pixel(col, row, .8)
-                    scrollphathd.show()
-
-                    if col == 0:
-                        direction = 1
+        fill_in_order(ZIGZAG_ORDER)
         if repeat > 0:
             run_count += 1
 
+def sweep_dot(order, brightness=.8):
+    """
+    Move a single lit pixel through each (col, row) of the (N, 2) array `order`,
+    one frame per position.
+
+    Only the previous and current positions change between frames, so just
+    those two entries of the frame are rewritten rather than clearing and
+    repainting it. The driver has no partial-update call, so each frame still
+    goes out whole in one `show()`.
+    """
+    frame = np.zeros((scrollphathd.width, scrollphathd.height), dtype=np.float32)
+    prev = None
+    for col, row in order.tolist():
+        if prev is not None:
+            frame[prev] = 0
+        frame[col, row] = brightness
+        prev = (col, row)
+        show_frame(frame)
+
 def row_zigzag_light(repeat=0):
     """
     Single moving LED that zig-zags across rows, left->right then right->left,
@@ -362,23 +488,7 @@ def row_zigzag_light(repeat=0):
     """
     run_count = 0
     while run_count <= repeat:
-        direction = 1  # 1 for left to right, -1 for right to left
-
-        for row in range(scrollphathd.height):
-            if direction == 1:
-                for col in range(scrollphathd.width):
-                    scrollphathd.set_pixel(col, row, .8)
-                    scrollphathd.show()
-                    scrollphathd.clear()
-                    if col == scrollphathd.width - 1:
-                        direction = -1
-            else:
-                for col in reversed(range(scrollphathd.width)):
-                    scrollphathd.set_pixel(col, row, .8)
-                    scrollphathd.show()
-                    scrollphathd.clear()
-                    if col == 0:
-                        direction = 1
+        sweep_dot(ZIGZAG_ORDER)
         if repeat > 0:
             run_count += 1
 
@@ -388,11 +498,7 @@ def column_fill_light(repeat=0):
     """
     run_count = 0
     while run_count <= repeat:
-        scrollphathd.clear()
-        for col in range(scrollphathd.width):
-            for row in range(scrollphathd.height):
-                scrollphathd.set_pixel(col, row, .8)
-                scrollphathd.show()
+        fill_in_order(COLUMN_ORDER)
         if repeat > 0:
             run_count += 1
 
@@ -402,11 +508,7 @@ def row_fill_light(repeat=0):
     """
     run_count = 0
     while run_count <= repeat:
-        scrollphathd.clear()
-        for row in range(scrollphathd.height):
-            for col in range(scrollphathd.width):
-                scrollphathd.set_pixel(col, row, .8)
-                scrollphathd.show()
+        fill_in_order(ROW_ORDER)
         if repeat > 0:
             run_count += 1
 
@@ -416,11 +518,7 @@ def column_sweep_light(repeat=0):
     """
     run_count = 0
     while run_count <= repeat:
-        for col in range(scrollphathd.width):
-            for row in range(scrollphathd.height):
-                scrollphathd.set_pixel(col, row, .8)
-                scrollphathd.show()
-                scrollphathd.clear()
+        sweep_dot(COLUMN_ORDER)
         if repeat > 0:
             run_count += 1
 
@@ -430,11 +528,7 @@ def row_sweep_light(repeat=0):
     """
     run_count = 0
     while run_count <= repeat:
-        for row in range(scrollphathd.height):
-            for col in range(scrollphathd.width):
-                scrollphathd.set_pixel(col, row, .8)
-                scrollphathd.show()
-                scrollphathd.clear()
+        sweep_dot(ROW_ORDER)
         if repeat > 0:
             run_count += 1
 
@@ -13,11 +13,26 @@ if hasattr(ic, "configureOutput"):
         includeContext=True,
     )
 
+# Set True to log bounces/completions from inside the effects. The calls are
+# skipped entirely when False, so step() doesn't pay for them every frame.
+DEBUG_EFFECTS = False
+
 ###------------------------------------------------------------------------------###
 
+import numpy as np
+
+# optional JIT compilation for the per-pixel kernels, falls back to numpy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 
 class BaseEffect:
+    # subclasses list their attributes in __slots__: no per-instance __dict__,
+    # and faster attribute access in step()
+    __slots__ = ()
+
     def step(self) -> list[tuple[int,int,float]]:
         """
         Returns a list of (x, y, brightness) for the current frame.
@@ -33,21 +48,68 @@ class BaseEffect:
         pass
 
 class LayeredEffect(BaseEffect):
+    """
+    Composites several effects into one frame.
+
+    Layers are blended in order into a persistent (w, h) accumulator; only the
+    pixels a layer actually lights are blended, so alpha/overwrite modes leave
+    the rest of the frame alone.
+    """
     def __init__(self, *layers):
         self.layers = layers
 
-    def step(self):
-        pixels:dict[tuple[int, int], float] = {}
+        w, h = scrollphathd.width, scrollphathd.height
+        self._acc = np.zeros((w, h))
+        self._lit = np.zeros((w, h), dtype=bool)
+
+    def _composite(self):
+        acc, lit = self._acc, self._lit
+        acc.fill(0)
+        lit.fill(False)
 
         for effect, blend in self.layers:
             if effect.is_done():
-                effect.reset()    
-            for x, y, b in effect.step():
-                key = (x, y)
-                existing = pixels.get(key, 0.0)
-                pixels[key] = blend.apply(existing, b)
-        
-        return [(x,y,b) for (x,y), b in pixels.items()]
+                effect.reset()
+
+            # the pixel list (not step_buffer) keeps repeated hits, see below
+            pixels = effect.step()
+            if not pixels:
+                continue
+
+            xs, ys, bs = zip(*pixels)
+            xs, ys = np.array(xs), np.array(ys)
+            bs = np.array(bs, dtype=float)
+
+            # pixels off the display are dropped, as they were never shown
+            w, h = acc.shape
+            on = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+            if not on.all():
+                xs, ys, bs = xs[on], ys[on], bs[on]
+
+            flat = np.ravel_multi_index((xs, ys), acc.shape)
+            lit.reshape(-1)[flat] = True
+
+            # A layer may hit the same pixel more than once (e.g. a trail
+            # doubling back); blend those in list order, one pass per repeat.
+            while flat.size:
+                _, first = np.unique(flat, return_index=True)
+                idx = flat[first]
+                acc.reshape(-1)[idx] = blend.apply(acc.reshape(-1)[idx], bs[first])
+
+                later = np.ones(flat.size, dtype=bool)
+                later[first] = False
+                flat, bs = flat[later], bs[later]
+
+    def step(self):
+        self._composite()
+
+        xs, ys = np.nonzero(self._lit)
+        return list(zip(xs.tolist(), ys.tolist(), self._acc[xs, ys].tolist()))
+
+    def step_buffer(self):
+        """The composited frame as a (w, h) array, as EffectRunner shows it."""
+        self._composite()
+        return np.abs(self._acc)
 
 class BlendMode:
     """Usage: alpha_blend = BlendMode(blend_alpha, alpha=0.35)"""
@@ -60,17 +122,18 @@ class BlendMode:
         return self.func(dst, src, **self.kwargs)
 ###-------------------------------------------------------------------------------###
 #Blend Functions
+# These work on floats or on numpy arrays of pixels (LayeredEffect blends a whole layer at once)
 def blend_max(dst: float, src: float) -> float:
     """Take the brightest value."""
-    return max(dst, src)
+    return np.maximum(dst, src)
 
 def blend_add(dst: float, src: float) -> float:
     """Additive blending, clamped to 1.0."""
-    return min(1.0, dst + src)
+    return np.minimum(1.0, dst + src)
 
 def blend_sub(dst: float, src: float) -> float:
     """Subtractive blending, clamped to 1.0."""
-    return min(1.0, src - dst)
+    return np.minimum(1.0, src - dst)
 
 def blend_alpha(dst: float, src: float, alpha: float = 0.5) -> float:
     """Alpha blending."""
@@ -104,6 +167,12 @@ class Sparkle(BaseEffect):
     If `speed` is None at construction, a random speed will be chosen at reset.
     """
 
+    __slots__ = ('x', 'y', '_fixed_speed', 'step_count', 'speed', 'max_steps',
+                 'brightness', '_lut')
+
+    # sine tables shared between sparkles, keyed by cycle length
+    _luts: dict[int, tuple[float, ...]] = {}
+
     def __init__(self, x, y, speed: int | None = None):
         """
         Store pixel coordinates and speed, then initialize state via `reset()`.
@@ -125,16 +194,26 @@ class Sparkle(BaseEffect):
         self.max_steps = self.speed
         self.brightness = 1
 
+        # brightness for every step of the cycle; the random start can land
+        # past max_steps, so the table always reaches step 50
+        lut = self._luts.get(self.max_steps)
+        if lut is None:
+            n = max(50, self.max_steps) + 1
+            lut = tuple(math.sin(i / self.max_steps * math.pi) for i in range(n))
+            self._luts[self.max_steps] = lut
+        self._lut = lut
+
     def step(self):
         """Advance the sparkle one step and return (x, y, normalized_brightness)."""
-        t = self.step_count / self.max_steps
-
-        brightness = math.sin(t * math.pi)  # smooth in/out
-
-        self.step_count += 1
+        # step_count is a plain int cycle counter: it indexes the sine table
+        # directly, so there's no float division or sin() per frame
+        count = self.step_count
+        brightness = self._lut[count]  # smooth in/out
 
-        if self.step_count > self.max_steps:
+        if count >= self.max_steps:
             self.reset()
+        else:
+            self.step_count = count + 1
 
         return [(self.x, self.y, brightness)]
 
@@ -144,10 +223,19 @@ class Sparkle(BaseEffect):
         return False
 
 class Comet(BaseEffect):
+    __slots__ = ('dx', 'dy', 'tail_length', '_tx', '_ty', '_order', 'bounce',
+                 'start_x', 'start_y', 'max_distance', 'x', 'y', '_head', '_len',
+                 'distance', '_w', '_h', '_trail_b')
+
     def __init__(self, x, y, dx=1, dy=0, tail_length=6, bounce=True):
         self.dx = dx
         self.dy = dy
-        self.tail = collections.deque(maxlen=tail_length)
+        self.tail_length = tail_length
+        # tail is a ring buffer of positions, newest entry lives at self._head
+        self._tx = np.zeros(tail_length, dtype=np.int16)
+        self._ty = np.zeros(tail_length, dtype=np.int16)
+        # _order[head] lists ring slots from `head` onwards, i.e. newest to oldest
+        self._order = (np.arange(tail_length)[:, None] + np.arange(tail_length)) % tail_length
         self.bounce = bounce
         self.start_x = float(x)
         self.start_y = float(y)
@@ -157,34 +245,52 @@ class Comet(BaseEffect):
     def reset(self):
         self.x = self.start_x
         self.y = self.start_y
-        self.tail.clear()
+        self._head = 0
+        self._len = 0
         self.distance = 0.0
 
+        # panel size never changes, so don't look it up every frame
+        self._w, self._h = scrollphathd.width, scrollphathd.height
+
+        # Tail falloff only depends on how many segments are lit, so build the
+        # brightness table for every possible length: _trail_b[n] has n entries.
+        L = self.tail_length
+        self._trail_b = [()] + [
+            tuple(max(0.05, (1.0 - i / n) ** 2) for i in range(n))
+            for n in range(1, L + 1)
+        ]
+
     def step(self):
-        w, h = scrollphathd.width, scrollphathd.height
+        w, h = self._w, self._h
         nx = self.x + self.dx
         ny = self.y + self.dy
 
         if self.bounce:
-            if nx < 0 or nx >= w:
-                ic("X bounce", self.x, self.dx)
-                self.dx *= -1
-                nx = self.x + self.dx
-            if ny < 0 or ny >= h:
-                ic("Y bounce", self.y, self.dy)
-                self.dy *= -1
-                ny = self.y + self.dy
+            # reflect without branching: a step that would leave the display
+            # flips the sign of that velocity component (bools act as 0/1)
+            flip_x = (nx < 0) | (nx >= w)
+            flip_y = (ny < 0) | (ny >= h)
+            if DEBUG_EFFECTS:
+                if flip_x:
+                    ic("X bounce", self.x, self.dx)
+                if flip_y:
+                    ic("Y bounce", self.y, self.dy)
+            self.dx *= 1 - 2 * flip_x
+            self.dy *= 1 - 2 * flip_y
+            nx = self.x + self.dx
+            ny = self.y + self.dy
         else:
             nx %= w
             ny %= h
 
         self.x, self.y = nx, ny
-        self.tail.appendleft((int(round(self.x)), int(round(self.y))))
+        self._head = (self._head - 1) % self.tail_length
+        self._tx[self._head] = round(self.x)
+        self._ty[self._head] = round(self.y)
+        self._len = min(self._len + 1, self.tail_length)
 
-        pixels = []
-        for i, (cx, cy) in enumerate(self.tail):
-            brightness = max(0.05, (1.0 - i / len(self.tail))**2)
-            pixels.append((cx, cy, brightness))
+        idx = self._order[self._head, :self._len]
+        pixels = list(zip(self._tx[idx].tolist(), self._ty[idx].tolist(), self._trail_b[self._len]))
         self.distance += math.hypot(self.dx, self.dy)
         return pixels
 
@@ -192,14 +298,44 @@ class Comet(BaseEffect):
         # return self.distance > self.max_distance
         return False
 
+def _ripple_front(dist, order, lo, hi, radius, fade, out):
+    # Write the wave-front brightness into the flat buffer `out` for the pixels
+    # in dist[lo:hi] (distances sorted ascending, order[k] is the flat index).
+    # With numba available this runs as one compiled loop over the ring
+    # instead of a chain of temporary numpy arrays.
+    for k in range(lo, hi):
+        # thickness of the wave front
+        delta = abs(dist[k] - radius)
+        if delta < 1.0:
+            # smooth bell-shaped brightness
+            out[order[k]] = math.cos(delta * math.pi / 2) * fade
+
+
+if njit is not None:
+    _ripple_front = njit(cache=True)(_ripple_front)
+else:
+    def _ripple_front(dist, order, lo, hi, radius, fade, out):
+        # Same as above, computed with numpy
+        delta = np.abs(dist[lo:hi] - radius)
+        ring = delta < 1.0
+        out[order[lo:hi][ring]] = np.cos(delta[ring] * math.pi / 2) * fade
+
+
 class WaveRipple(BaseEffect):
     """
     Expanding circular ripple effect.
 
     A ripple originates from a point, expands outward, and fades over time.
     Each step returns a list of (x, y, brightness) tuples.
+
+    `cx`/`cy` may be changed (or be fractional) while the ripple runs; the
+    distance grid is only rebuilt on frames where the centre has moved.
     """
 
+    __slots__ = ('cx', 'cy', 'speed', '_max_radius', 'radius', 'done', 'max_radius',
+                 '_w', '_h', '_gx', '_gy', '_dist', '_dist_centre', '_order',
+                 '_sorted_dist', '_front_buf')
+
     def __init__(self, cx, cy, speed=0.5, max_radius=None):
         """
         Args:
@@ -217,39 +353,72 @@ class WaveRipple(BaseEffect):
         self.radius = 0.0
         self.done = False
 
-        w, h = scrollphathd.width, scrollphathd.height
+        # panel size never changes, so don't look it up every frame
+        self._w, self._h = scrollphathd.width, scrollphathd.height
+        w, h = self._w, self._h
 
         self.max_radius = self._max_radius or math.hypot(w, h)
 
-    def step(self):
-        if self.done:
-            return []
+        # pixel coordinates as a column and a row, broadcast against each other
+        # to give the distance from the centre to every pixel in one np.hypot
+        self._gx = np.arange(w, dtype=float)[:, None]
+        self._gy = np.arange(h, dtype=float)[None, :]
+        self._dist = np.empty((w, h))
+        self._dist_centre = None
+        self._front_buf = np.zeros((w, h))
 
-        pixels = []
-        w, h = scrollphathd.width, scrollphathd.height
+    def _distances(self):
+        """
+        Pixel distances from the centre in ascending order, and the flat index
+        of each; recomputed only when the centre moves.
+        """
+        centre = (self.cx, self.cy)
+        if centre != self._dist_centre:
+            np.hypot(self._gx - self.cx, self._gy - self.cy, out=self._dist)
+            self._order = np.argsort(self._dist, axis=None, kind='stable')
+            self._sorted_dist = self._dist.reshape(-1)[self._order]
+            self._dist_centre = centre
+        return self._sorted_dist, self._order
+
+    def _front(self):
+        """Return the (w, h) brightness of the wave front, then expand the ripple."""
+        fade = max(0.0, 1.0 - round(self.radius) / round(self.max_radius))
+        dist, order = self._distances()
+
+        # only pixels within one of the radius light up, a thin ring that a
+        # binary search over the sorted distances finds without visiting the rest
+        # (the band is taken inclusive and the kernel does the exact < 1 test)
+        lo = np.searchsorted(dist, self.radius - 1.0, side='left')
+        hi = np.searchsorted(dist, self.radius + 1.0, side='right')
+
+        brightness = self._front_buf
+        brightness.fill(0.0)
+        _ripple_front(dist, order, lo, hi, self.radius, fade, brightness.reshape(-1))
+
+        self.radius += self.speed
 
-        for x in range(w):
-            for y in range(h):
-                dist = math.hypot(x - self.cx, y - self.cy)
+        if round(self.radius) > round(self.max_radius):
+            if DEBUG_EFFECTS:
+                ic("Ripple done",self.radius)
+            self.done = True
 
-                # thickness of the wave front
-                delta = abs(dist - self.radius)
+        return brightness
 
-                if delta < 1.0:
-                    # smooth bell-shaped brightness
-                    brightness = math.cos(delta * math.pi / 2)
-                    brightness *= max(0.0, 1.0 - round(self.radius) / round(self.max_radius))
+    def step(self):
+        if self.done:
+            return []
 
-                    if brightness > 0:
-                        pixels.append((x, y, brightness))
+        brightness = self._front()
 
-        self.radius += self.speed
+        xs, ys = np.nonzero(brightness > 0)
+        return list(zip(xs.tolist(), ys.tolist(), brightness[xs, ys].tolist()))
 
-        if round(self.radius) > round(self.max_radius):
-            ic("Ripple done",self.radius)
-            self.done = True
+    def step_buffer(self):
+        """Same frame as `step()`, as a dense (w, h) float32 array."""
+        if self.done:
+            return np.zeros((self._w, self._h), dtype=np.float32)
 
-        return pixels
+        return self._front().astype(np.float32)
 
     def is_done(self):
         return self.done
@@ -259,6 +428,10 @@ class ScannerSweep(BaseEffect):
     Sweeping scanner / radar-style line with a fading trail.
     """
 
+    __slots__ = ('horizontal', 'speed', 'trail_length', 'bounce', '_bounces', 'pos',
+                 'x_direction', 'trail', 'done', '_w', '_h', '_trail_b',
+                 '_line', '_along', '_across', '_line_b')
+
     def __init__(self, horizontal=True, speed=1, trail_length=5, bounce=True):
         """
         Args:
@@ -280,41 +453,72 @@ class ScannerSweep(BaseEffect):
         self.trail = collections.deque(maxlen=self.trail_length)
         self.done = False
 
-    def step(self):
-        if self.done:
-            return []
+        # panel size never changes, so don't look it up every frame
+        self._w, self._h = scrollphathd.width, scrollphathd.height
 
-        w, h = scrollphathd.width, scrollphathd.height
+        # brightness of each trail position, newest first
+        self._trail_b = tuple(
+            max(0.05, (1.0 - i / self.trail_length) ** 2) for i in range(self.trail_length))
 
+        # step() output for a full trail, one line of pixels per trail entry:
+        # _along holds each line's position (filled per frame), _across the
+        # coordinate that runs along the line and _line_b its brightness
+        self._line = self._h if self.horizontal else self._w
+        self._along = np.empty((self.trail_length, self._line), dtype=np.int16)
+        self._across = np.tile(np.arange(self._line), self.trail_length)
+        self._line_b = np.repeat(self._trail_b, self._line)
+
+    def _advance(self):
         # move scanner
         self.pos += self.x_direction * self.speed
 
-        limit = w - 1 if self.horizontal else h - 1
+        limit = self._w - 1 if self.horizontal else self._h - 1
 
-        if self.pos < 0 or self.pos > limit:
-            if self.bounce:
-                self.x_direction *= -1
-                self.pos += self.x_direction * self.speed
-                self._bounces += 1
-            else:
-                self.pos = 0
-                self.done = True
+        if self.bounce:
+            # reflect without branching (bools act as 0/1): a step past either
+            # end flips the direction and is taken back
+            out = (self.pos < 0) | (self.pos > limit)
+            self.x_direction *= 1 - 2 * out
+            self.pos += out * self.x_direction * self.speed
+            self._bounces += out
+        elif self.pos < 0 or self.pos > limit:
+            self.pos = 0
+            self.done = True
 
         self.trail.appendleft(int(self.pos))
 
-        pixels = []
+    def step(self):
+        if self.done:
+            return []
+
+        self._advance()
 
-        for i, p in enumerate(self.trail):
-            brightness = max(0.05, (1.0 - i / self.trail_length) ** 2)
+        lines = len(self.trail)
+        n = lines * self._line
+        along = self._along[:lines]
+        along[:] = np.array(self.trail)[:, None]
 
-            if self.horizontal:
-                for y in range(h):
-                    pixels.append((p, y, brightness))
-            else:
-                for x in range(w):
-                    pixels.append((x, p, brightness))
+        along = along.reshape(-1).tolist()
+        across = self._across[:n].tolist()
+        xs, ys = (along, across) if self.horizontal else (across, along)
 
-        return pixels
+        return list(zip(xs, ys, self._line_b[:n].tolist()))
+
+    def step_buffer(self):
+        """Same frame as `step()`, as a dense (w, h) float32 array."""
+        frame = np.zeros((self._w, self._h), dtype=np.float32)
+
+        if self.done:
+            return frame
+
+        self._advance()
+
+        # each trail entry lights a whole column (or row), oldest written last
+        lines = frame if self.horizontal else frame.T
+        for p, brightness in zip(self.trail, self._trail_b):
+            lines[p] = brightness
+
+        return frame
 
     def is_done(self):
         return self.done
@@ -327,6 +531,9 @@ class ZigZagSweep(BaseEffect):
     next row, reversing horizontal direction each time.
     """
 
+    __slots__ = ('speed', 'trail_length', 'bounce', 'w', 'h', 'row', 'col',
+                 'x_direction', 'y_direction', 'trail', 'done', '_trail_b')
+
     def __init__(self, speed=1, trail_length=6, bounce=True):
         self.speed = speed
         self.trail_length = trail_length
@@ -345,18 +552,21 @@ class ZigZagSweep(BaseEffect):
         self.trail = collections.deque(maxlen=self.trail_length)
         self.done = False
 
+        # brightness of each trail position, newest first
+        self._trail_b = tuple(
+            max(0.05, (1.0 - i / self.trail_length) ** 2) for i in range(self.trail_length))
+
     def step(self):
         if self.done:
             return []
 
-        pixels = []
-
         # Move horizontally
         self.col += self.x_direction * self.speed
 
         # Hit left/right edge?
         if self.col < 0 or self.col >= self.w:
-            ic("row change", self.row, self.x_direction)
+            if DEBUG_EFFECTS:
+                ic("row change", self.row, self.x_direction)
             # Clamp column
             self.col = max(0, min(self.w - 1, self.col))
 
@@ -368,7 +578,8 @@ class ZigZagSweep(BaseEffect):
 
             # Hit top/bottom?
             if self.row < 0 or self.row >= self.h:
-                ic("Reverse vertical", self.row, self.y_direction)
+                if DEBUG_EFFECTS:
+                    ic("Reverse vertical", self.row, self.y_direction)
                 if self.bounce:
                     # Clamp row
                     self.row = max(0, min(self.h - 1, self.row))
@@ -380,11 +591,7 @@ class ZigZagSweep(BaseEffect):
 
         self.trail.appendleft((self.col, self.row))
 
-        for i, (x, y) in enumerate(self.trail):
-            brightness = max(0.05, (1.0 - i / self.trail_length) ** 2)
-            pixels.append((x, y, brightness))
-
-        return pixels
+        return [(x, y, b) for (x, y), b in zip(self.trail, self._trail_b)]
 
     def is_done(self):
         return self.done
@@ -396,8 +603,14 @@ import scrollphathd
 class EffectRunner:
     """
     Runs any BaseEffect on Scroll pHAT HD.
+
+    Frames are written into the display buffer in one go from the `before_display`
+    hook rather than a `set_pixel` per pixel. Effects that provide `step_buffer()`
+    hand back a whole (w, h) frame, which is copied in directly.
+
+    One runner can play several effects in a row with `run_playlist()`.
     """
-    def __init__(self, effect: BaseEffect, fps: float = 20.0):
+    def __init__(self, effect: BaseEffect | None = None, fps: float = 20.0):
 
         self.effect = effect
         self.frame_delay = 1.0 / fps
@@ -406,23 +619,30 @@ class EffectRunner:
         # How many times we've run the effect, how many 'Frames' if you will
         run_count = 0
 
-        # Main loop
-        while True:
-            # clear buffer
-            scrollphathd.clear()
-            # get frame pixels from effect
-            pixels = self.effect.step()
+        step_buffer = getattr(self.effect, 'step_buffer', None)
 
-            # update pixels in buffer
-            for x, y, b in pixels:
-                scrollphathd.set_pixel(x, y, abs(b))
+        # frames are paced against a monotonic schedule, so time spent in
+        # step()/show() doesn't add to the delay and slow the effect down
+        next_frame = time.monotonic()
 
-            # display buffer
-            scrollphathd.show()
+        # Clear the buffer once. Frames are only ever drawn into the cropped copy
+        # that show() hands to before_display, so the buffer itself stays blank
+        # and doesn't need clearing again every frame.
+        scrollphathd.clear()
+
+        # Main loop
+        while True:
+            if step_buffer is not None:
+                # get the whole frame from the effect and display it
+                self._show_buffer(step_buffer())
+            else:
+                # get frame pixels from effect and display them
+                self._show_pixels(self.effect.step())
 
             # check if effect is done
             if self.effect.is_done():
-                ic(type(self.effect).__name__, "completed")
+                if DEBUG_EFFECTS:
+                    ic(type(self.effect).__name__, "completed")
                 self.effect.reset()
 
             # handle repeat count
@@ -432,7 +652,56 @@ class EffectRunner:
                     break
 
             # wait for next frame
-            time.sleep(self.frame_delay)
+            next_frame += self.frame_delay
+            delay = next_frame - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # running late: restart the schedule rather than rushing to catch up
+                next_frame = time.monotonic()
+
+    def run_playlist(self, items: list[tuple[BaseEffect, int, float]]):
+        """
+        Play effects back to back on this runner.
+
+        Args:
+            items: (effect, repeat, fps) tuples, played in order. A repeat of 0
+                runs that effect forever, so only use it for the last item.
+        """
+        for effect, repeat, fps in items:
+            self.effect = effect
+            self.frame_delay = 1.0 / fps
+            self.run(repeat=repeat)
+
+    @staticmethod
+    def _show_pixels(pixels):
+        """Write a list of (x, y, brightness) into the display buffer in one go and show it."""
+        if not pixels:
+            scrollphathd.show()
+            return
+
+        xs, ys, bs = zip(*pixels)
+        xs, ys = np.array(xs), np.array(ys)
+        bs = np.minimum(np.abs(bs), 1.0)
+
+        def paint(buf):
+            # drop pixels off the display; repeated pixels keep the last
+            # value, as with set_pixel
+            w, h = buf.shape
+            on = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+            buf[xs[on], ys[on]] = bs[on]
+            return buf
+
+        scrollphathd.show(before_display=paint)
+
+    @staticmethod
+    def _show_buffer(frame):
+        """Copy a (w, h) brightness array into the display buffer and show it."""
+        def paint(buf):
+            np.copyto(buf, frame)
+            return buf
+
+        scrollphathd.show(before_display=paint)
 
 
 if __name__ == '__main__':
@@ -447,45 +716,29 @@ if __name__ == '__main__':
         # Set max brightness
         scrollphathd.set_brightness(0.8)
 
-        # This Works so Well!
-        layered = LayeredEffect(
-            (WaveRipple(8, 3, speed=0.7), BLEND_OFF),
-            (WaveRipple(3, 8, speed=0.7), BLEND_MAX),
-            (WaveRipple(5, 5, speed=0.7), BLEND_OFF))
-        runner = EffectRunner(layered, fps=25)
-        runner.run(repeat=200)
-
-        # # This Works so Well!
-        # layered = LayeredEffect(
-        #     (Comet(0, 0, dx=1, dy=2, tail_length=4, bounce=True), BLEND_ALPHA_HARD),
-        #     (Comet(16, 0, dx=2, dy=1, tail_length=9, bounce=True), BLEND_ALPHA_HARD))
-        # runner = EffectRunner(layered, fps=25)
-        # runner.run(repeat=200)
-        # zigzag = ZigZagSweep(speed=1,trail_length=5,bounce=True)
-
-        # runner = EffectRunner(zigzag, fps=25)
-        # runner.run(repeat=400)
-
-        # scanner = ScannerSweep(horizontal=True,speed=1,trail_length=6,bounce=True)
-
-        # runner = EffectRunner(scanner, fps=20)
-        # runner.run(repeat=400)
-
-
-        # ripple = WaveRipple(8, 3, speed=0.7)
-
-        # runner = EffectRunner(ripple, fps=30)
-        # runner.run(repeat=200)
-
-        # sparkle = Sparkle(3, 4)
-        # comet = Comet(0, 0, dx=1, dy=1, tail_length=6)
-
-        # runner = EffectRunner(sparkle)
-        # runner.run(repeat=200)  # run sparkle
-
-        # runner = EffectRunner(comet)
-        # runner.run(repeat=200)
-        pass
+        # One runner plays everything; uncomment entries to add them to the show.
+        # Each entry is (effect, repeat, fps).
+        playlist = [
+            # This Works so Well!
+            (LayeredEffect(
+                (WaveRipple(8, 3, speed=0.7), BLEND_OFF),
+                (WaveRipple(3, 8, speed=0.7), BLEND_MAX),
+                (WaveRipple(5, 5, speed=0.7), BLEND_OFF)), 200, 25),
+
+            # # This Works so Well!
+            # (LayeredEffect(
+            #     (Comet(0, 0, dx=1, dy=2, tail_length=4, bounce=True), BLEND_ALPHA_HARD),
+            #     (Comet(16, 0, dx=2, dy=1, tail_length=9, bounce=True), BLEND_ALPHA_HARD)), 200, 25),
+
+            # (ZigZagSweep(speed=1,trail_length=5,bounce=True), 400, 25),
+            # (ScannerSweep(horizontal=True,speed=1,trail_length=6,bounce=True), 400, 20),
+            # (WaveRipple(8, 3, speed=0.7), 200, 30),
+            # (Sparkle(3, 4), 200, 20),
+            # (Comet(0, 0, dx=1, dy=1, tail_length=6), 200, 20),
+        ]
+
+        runner = EffectRunner()
+        runner.run_playlist(playlist)
 
     except KeyboardInterrupt:
         scrollphathd.clear()
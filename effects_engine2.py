@@ -13,6 +13,17 @@ if hasattr(ic, "configureOutput"):
         includeContext=True,
     )
 
+# Set True to log bounces/completions from inside the effects. The calls are
+# skipped entirely when False, so step() doesn't pay for them every frame.
+DEBUG_EFFECTS = False
+
+###------------------------------------------------------------------------------###
+import scrollphathd
+
+# The panel never changes size, so read its dimensions once instead of
+# looking them up on the scrollphathd module every frame
+WIDTH, HEIGHT = scrollphathd.width, scrollphathd.height
+
 ###------------------------------------------------------------------------------###
 # Helper Functions
 
@@ -26,20 +37,33 @@ def clamp01(v: float) -> float:
     This is used to ensure LED brightness values are always valid
     before being sent to the display hardware.
     """
-    return max(0.0, min(1.0, abs(v)))
+    # Plain comparisons rather than abs()/min()/max() calls; NaN still
+    # comes out as 1.0, as it did with min(1.0, ...)
+    if v < 0.0:
+        v = -v
+    return v if v <= 1.0 else 1.0
 
 from contextlib import contextmanager
+from functools import lru_cache
+import numpy as np
 
 @contextmanager
 def capture_pixels():
-    """This safely hijacks rendering and restores it afterward."""
-    captured = {}
+    """
+    This safely hijacks rendering and restores it afterward.
+
+    Yields a [x, y] brightness array the size of the display. A pixel drawn
+    more than once keeps its brightest value; pixels off the display are
+    dropped.
+    """
+    w, h = WIDTH, HEIGHT
+    captured = np.zeros((w, h))
 
     original_set_pixel = scrollphathd.set_pixel
 
     def fake_set_pixel(x, y, b):
-        if b > 0:
-            captured[(x, y)] = max(captured.get((x, y), 0.0), b)
+        if b > 0 and 0 <= x < w and 0 <= y < h and b > captured[x, y]:
+            captured[x, y] = b
 
     scrollphathd.set_pixel = fake_set_pixel
     try:
@@ -54,10 +78,26 @@ def rasterize_string(
     y=0,
     brightness=1.0,
     **kwargs
-) -> dict[tuple[int, int], float]:
+) -> np.ndarray:
     """
-    Returns {(x, y): brightness} for text drawn via write_string.
+    Returns a [x, y] brightness array for text drawn via write_string.
+
+    The same text is usually drawn every frame, so results are cached and
+    shared between calls; the returned array is read-only.
     """
+    try:
+        return _rasterize_cached(text, x, y, brightness, tuple(sorted(kwargs.items())))
+    except TypeError:
+        # unhashable keyword arguments can't be cached
+        return _rasterize(text, x, y, brightness, **kwargs)
+
+@lru_cache(maxsize=64)
+def _rasterize_cached(text, x, y, brightness, kwargs):
+    pixels = _rasterize(text, x, y, brightness, **dict(kwargs))
+    pixels.flags.writeable = False
+    return pixels
+
+def _rasterize(text, x, y, brightness, **kwargs):
     with capture_pixels() as pixels:
         scrollphathd.clear()
         scrollphathd.write_string(
@@ -72,6 +112,7 @@ def rasterize_string(
 
 ###-------------------------------------------------------------------------------###
 from enum import Enum
+import operator
 
 class BlendMode(Enum):
     """
@@ -93,16 +134,69 @@ class BlendMode(Enum):
     ALPHA_HARD = "alpha_hard"
     OVERWRITE = "overwrite"
 
+def _overwrite(dst, src):
+    return src
+
+# How each BlendMode combines a destination and source brightness. Looked up
+# once per call instead of walking a chain of enum comparisons; any unknown
+# mode falls back to OVERWRITE.
+_BLENDERS = {
+    BlendMode.MAX: max,
+    BlendMode.ADD: operator.add,
+    BlendMode.ALPHA_SOFT: lambda d, s: d * 0.75 + s * 0.25,
+    BlendMode.ALPHA_HARD: lambda d, s: d * 0.4 + s * 0.6,
+    BlendMode.OVERWRITE: _overwrite,
+}
+
 def blend(dst: float, src: float, mode: BlendMode) -> float:
-    if mode == BlendMode.MAX:
-        return max(dst, src)
-    if mode == BlendMode.ADD:
-        return dst + src
-    if mode == BlendMode.ALPHA_SOFT:
-        return dst * 0.75 + src * 0.25
-    if mode == BlendMode.ALPHA_HARD:
-        return dst * 0.4 + src * 0.6
-    return src  # OVERWRITE
+    return _BLENDERS.get(mode, _overwrite)(dst, src)
+
+def _pixel_arrays(pixels, w, h):
+    """
+    Split (x, y, brightness) pixels into x, y and brightness arrays,
+    dropping any that don't land on a w x h display.
+    """
+    xs, ys, bs = zip(*pixels)
+    xs = np.array(xs, dtype=np.float64)
+    ys = np.array(ys, dtype=np.float64)
+    bs = np.array(bs, dtype=np.float64)
+
+    # Non-integer coordinates never matched a display pixel either
+    on = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h) & (xs % 1 == 0) & (ys % 1 == 0)
+    return xs[on].astype(np.intp), ys[on].astype(np.intp), bs[on]
+
+def _pointwise_merge(blender):
+    """
+    Build a canvas merge that blends pixels one occurrence at a time.
+
+    A layer can draw the same pixel more than once (e.g. a tail crossing
+    itself). The first remaining occurrence of every pixel is blended,
+    then the next, and so on, so repeats blend in the order they were
+    drawn, exactly as calling blend() on each pixel in turn would.
+    """
+    def merge(canvas, idx, bs):
+        while len(idx):
+            first_idx, first = np.unique(idx, return_index=True)
+            canvas[first_idx] = blender(canvas[first_idx], bs[first])
+
+            rest = np.ones(len(idx), dtype=bool)
+            rest[first] = False
+            idx, bs = idx[rest], bs[rest]
+    return merge
+
+def _overwrite_merge(canvas, idx, bs):
+    # Overwriting doesn't depend on the canvas, so one assignment does it;
+    # for repeated pixels the last one wins
+    canvas[idx] = bs
+
+# How a layer's pixels (flat canvas indices + brightness) are merged into
+# the LayeredEffect canvas for each BlendMode. MAX and ADD have unbuffered
+# ufunc.at scatter-reductions that apply repeated pixels in order in a
+# single C call; the alpha blends go through the occurrence loop.
+_CANVAS_MERGES = {mode: _pointwise_merge(f) for mode, f in _BLENDERS.items()}
+_CANVAS_MERGES[BlendMode.MAX] = np.maximum.at
+_CANVAS_MERGES[BlendMode.ADD] = np.add.at
+_CANVAS_MERGES[BlendMode.OVERWRITE] = _overwrite_merge
 
 
 class BaseEffect:
@@ -115,6 +209,7 @@ class BaseEffect:
 
     Contract:
         - step() returns a list of (x, y, brightness) tuples
+        - step_into(fb) draws the same frame straight into an array
         - reset() restores the effect to its initial state
         - is_done() indicates whether the effect has finished
     """
@@ -122,6 +217,19 @@ class BaseEffect:
         """Return (x, y, brightness) pixels for this frame."""
         raise NotImplementedError
 
+    def step_into(self, fb: np.ndarray):
+        """
+        Advance one frame and draw it into fb, a [x, y] brightness array.
+
+        Pixels drawn later replace earlier ones and pixels off the display
+        are dropped, as the runner has always shown them. The default goes
+        through step(); effects can override it to skip the tuple list.
+        """
+        pixels = self.step()
+        if pixels:
+            xs, ys, bs = _pixel_arrays(pixels, *fb.shape)
+            fb[xs, ys] = bs
+
     def reset(self):
         """Reset internal state so the effect can be replayed."""
         pass
@@ -146,6 +254,8 @@ class Layer():
     def __init__(self, effect: BaseEffect, blend: BlendMode = BlendMode.MAX):
         self.effect = effect
         self.blend = blend
+        # canvas merge for this blend mode, picked once instead of per frame
+        self._merge = _CANVAS_MERGES.get(blend, _overwrite_merge)
 
 class LayeredEffect(BaseEffect):
     """
@@ -161,26 +271,64 @@ class LayeredEffect(BaseEffect):
     def __init__(self, *layers: Layer):
         self.layers = layers
 
+        # Composite brightness per pixel, indexed [x, y], and which pixels
+        # any layer drew this frame (a layer can draw a pixel at 0.0)
+        w, h = WIDTH, HEIGHT
+        self._canvas = np.zeros((w, h))
+        self._lit = np.zeros((w, h), dtype=bool)
+        # frame that overwriting layers draw into before being copied over
+        self._scratch = np.empty((w, h))
+
     def step(self):
-        pixels: dict[tuple[int, int], float] = {}
+        self._composite()
+        xs, ys = np.nonzero(self._lit)
+        return list(zip(xs.tolist(), ys.tolist(), self._canvas[xs, ys].tolist()))
+
+    def step_into(self, fb):
+        self._composite()
+        fb[self._lit] = self._canvas[self._lit]
+
+    def _composite(self):
+        """Blend every layer's pixels for this frame into _canvas / _lit."""
+        canvas, lit, scratch = self._canvas, self._lit, self._scratch
+        canvas.fill(0.0)
+        lit.fill(False)
+        w, h = canvas.shape
 
         for layer in self.layers:
             if layer.effect.is_done():
                 layer.effect.reset()
 
-            if isinstance(layer.effect, BufferEffect):
-
-                layer.effect.step()  # effect draws directly
+            overwrite = layer._merge is _overwrite_merge
+
+            if overwrite or isinstance(layer.effect, BufferEffect):
+                # Let the effect draw straight into a scratch frame, with no
+                # tuple list; NaN marks the pixels it didn't touch. step_into
+                # keeps one value per pixel, which is exact for overwriting
+                # (the last value wins) and for buffer effects (their drawing
+                # is captured one value per pixel). Showing and pacing frames
+                # is left to the runner.
+                scratch.fill(np.nan)
+                layer.effect.step_into(scratch)
+                drawn = ~np.isnan(scratch)
+
+                if overwrite:
+                    canvas[drawn] = scratch[drawn]
+                    lit |= drawn
+                    continue
 
-                scrollphathd.show()
-                time.sleep(1/20)
-                continue
+                xs, ys = np.nonzero(drawn)
+                bs = scratch[xs, ys]
+            else:
+                pixels = layer.effect.step()
+                if not pixels:
+                    continue
 
-            for x, y, b in layer.effect.step():
-                key = (x, y)
-                pixels[key] = blend(pixels.get(key, 0.0), b, layer.blend)
+                xs, ys, bs = _pixel_arrays(pixels, w, h)
 
-        return [(x, y, b) for (x, y), b in pixels.items()]
+            idx = xs * h + ys
+            lit.reshape(-1)[idx] = True
+            layer._merge(canvas.reshape(-1), idx, bs)
 
     def reset(self):
         for layer in self.layers:
@@ -188,10 +336,32 @@ class LayeredEffect(BaseEffect):
 ###-------------------------------------------------------------------------------###
 
 import math
-import collections
+import os
 import random
 from random import randint
 
+# Numba is optional: when it is installed the per-pixel kernels below are
+# compiled, otherwise equivalent numpy versions are used instead. Numba
+# reads globals as compile-time constants, so kernels that loop over or
+# index by WIDTH/HEIGHT are specialised for the fixed 17x7 panel.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+@lru_cache(maxsize=None)
+def _ring_order(length):
+    """
+    Read order table for a ring buffer of `length` slots.
+
+    Row `head` lists the slot indices newest-first when the latest write
+    went to slot `head`, so a trail of n entries is ring[order[head, :n]].
+    """
+    steps = np.arange(length)
+    order = (steps[:, None] - steps[None, :]) % length
+    order.flags.writeable = False
+    return order
+
 class Sparkle(BaseEffect):
     """
     Represents one pixel that brightens then fades at a fixed or random speed.
@@ -201,6 +371,9 @@ class Sparkle(BaseEffect):
     If `speed` is None at construction, a random speed will be chosen at reset.
     """
 
+    # sine tables shared between sparkles, keyed by cycle length
+    _luts: dict[int, tuple[float, ...]] = {}
+
     def __init__(self, x, y, speed: int | None = None):
         """
         Store pixel coordinates and speed, then initialize state via `reset()`.
@@ -222,22 +395,117 @@ class Sparkle(BaseEffect):
         self.max_steps = self.speed
         self.brightness = 1
 
+        # brightness for every step of the cycle; the random start can land
+        # past max_steps, so the table always reaches step 50
+        lut = self._luts.get(self.max_steps)
+        if lut is None:
+            n = max(50, self.max_steps) + 1
+            lut = tuple(math.sin(i / self.max_steps * math.pi) for i in range(n))
+            self._luts[self.max_steps] = lut
+        self._lut = lut
+
     def step(self):
         """Advance the sparkle one step and return (x, y, normalized_brightness)."""
-        t = self.step_count / self.max_steps
+        return [(self.x, self.y, self._advance())]
+
+    def step_into(self, fb):
+        brightness = self._advance()
+        w, h = fb.shape
+        if 0 <= self.x < w and 0 <= self.y < h:
+            fb[self.x, self.y] = brightness
 
-        brightness = math.sin(t * math.pi)  # smooth in/out
+    def _advance(self):
+        """Advance the sparkle one step and return its brightness."""
+        brightness = self._lut[self.step_count]  # smooth in/out
 
         self.step_count += 1
 
         if self.step_count > self.max_steps:
             self.reset()
 
-        return [(self.x, self.y, brightness)]
+        return brightness
 
     def is_done(self):
-        # """Return True when the sparkle cycle finishes (brightness == 0)."""
-        return self.step_count > self.max_steps
+        # A sparkle restarts itself at the end of every cycle, so it never
+        # finishes; reporting the end of the cycle here made LayeredEffect
+        # reset it a second time whenever a new cycle started past its end
+        return False
+
+class SparkleField(BaseEffect):
+    """
+    Many sparkles at once, kept in parallel arrays instead of one Sparkle
+    object each, so a whole field advances in a few numpy operations.
+
+    Each sparkle sits on its own randomly chosen pixel and cycles exactly
+    like a Sparkle: it starts at a random step and, unless `speed` is
+    given, picks a new random speed every time its cycle ends.
+
+    Args:
+        density (int): Number of sparkles (at most one per pixel).
+        speed (int | None): Fixed cycle length, or None for random speeds.
+    """
+
+    # how many random (start step, speed) pairs are drawn at a time
+    _POOL_SIZE = 4096
+
+    def __init__(self, density: int = 30, speed: int | None = None):
+        self.density = density
+        self._fixed_speed = speed
+        self.reset()
+
+    def reset(self):
+        w, h = WIDTH, HEIGHT
+        n = min(self.density, w * h)
+
+        # distinct random pixels, one per sparkle
+        cells = np.random.choice(w * h, n, replace=False)
+        self.xs, self.ys = np.divmod(cells, h)
+
+        self.step_count = np.zeros(n, dtype=np.intp)
+        self.max_steps = np.zeros(n, dtype=np.intp)
+        self._pool_pos = self._POOL_SIZE
+        self._restart(np.ones(n, dtype=bool))
+
+        # brightness for every (cycle length, step) pair, built the same way
+        # as Sparkle's tables
+        longest = max(50, self._fixed_speed or 50)
+        self._lut = np.array([
+            [math.sin(i / m * math.pi) if m else 0.0 for i in range(longest + 1)]
+            for m in range(longest + 1)
+        ])
+
+    def _restart(self, which):
+        """Start a new cycle for the sparkles selected by the `which` mask."""
+        k = np.count_nonzero(which)
+        if not k:
+            return
+
+        # Take the random values from a pool that is refilled in bulk, rather
+        # than calling the generator every time a cycle ends
+        if self._pool_pos + k > self._POOL_SIZE:
+            self._pool = np.random.randint((0, 10), 51, (self._POOL_SIZE, 2))
+            self._pool_pos = 0
+        draw = self._pool[self._pool_pos:self._pool_pos + k]
+        self._pool_pos += k
+
+        self.step_count[which] = draw[:, 0]
+        self.max_steps[which] = self._fixed_speed or draw[:, 1]
+
+    def step(self):
+        brightness = self._advance()
+        return list(zip(self.xs.tolist(), self.ys.tolist(), brightness.tolist()))
+
+    def step_into(self, fb):
+        fb[self.xs, self.ys] = self._advance()
+
+    def _advance(self):
+        """Advance every sparkle one step and return their brightness."""
+        brightness = self._lut[self.max_steps, self.step_count]  # smooth in/out
+
+        self.step_count += 1
+        self._restart(self.step_count > self.max_steps)
+
+        return brightness
 
 class Comet(BaseEffect):
     """
@@ -269,7 +537,12 @@ class Comet(BaseEffect):
     def __init__(self, x, y, dx=1, dy=0, tail_length=6, bounce=True):
         self.dx = dx
         self.dy = dy
-        self.tail = collections.deque(maxlen=tail_length)
+        self.tail_length = tail_length
+        # Brightness of each tail segment, newest first; the tail grows one
+        # segment per step until it is full, so row n is for an n-long tail
+        self._fades = np.zeros((tail_length + 1, tail_length))
+        for n in range(1, tail_length + 1):
+            self._fades[n, :n] = [max(0.05, (1.0 - i / n) ** 2) for i in range(n)]
         self.bounce = bounce
         self.start_x = float(x)
         self.start_y = float(y)
@@ -279,21 +552,48 @@ class Comet(BaseEffect):
     def reset(self):
         self.x = self.start_x
         self.y = self.start_y
-        self.tail.clear()
         self.distance = 0.0
+        # Distance covered per step; bouncing only flips the signs of dx/dy,
+        # so this stays the same for the whole run
+        self._step_dist = math.hypot(self.dx, self.dy)
+
+        # Tail positions live in a fixed ring buffer; _head is the slot of
+        # the newest entry and _len how many slots are filled
+        self._tail_x = np.zeros(self.tail_length, np.int16)
+        self._tail_y = np.zeros(self.tail_length, np.int16)
+        self._order = _ring_order(self.tail_length)
+        self._head = -1
+        self._len = 0
 
     def step(self):
-        w, h = scrollphathd.width, scrollphathd.height
+        xs, ys, bs = self._advance()
+        return list(zip(xs.tolist(), ys.tolist(), bs.tolist()))
+
+    def step_into(self, fb):
+        xs, ys, bs = self._advance()
+
+        w, h = fb.shape
+        on = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+        fb[xs[on], ys[on]] = bs[on]
+
+    def _advance(self):
+        """
+        Move the head one step and return the tail's x, y and brightness
+        arrays, newest first.
+        """
+        w, h = WIDTH, HEIGHT
         nx = self.x + self.dx
         ny = self.y + self.dy
 
         if self.bounce:
             if nx < 0 or nx >= w:
-                ic("X bounce", self.x, self.dx)
+                if DEBUG_EFFECTS:
+                    ic("X bounce", self.x, self.dx)
                 self.dx *= -1
                 nx = self.x + self.dx
             if ny < 0 or ny >= h:
-                ic("Y bounce", self.y, self.dy)
+                if DEBUG_EFFECTS:
+                    ic("Y bounce", self.y, self.dy)
                 self.dy *= -1
                 ny = self.y + self.dy
         else:
@@ -301,19 +601,62 @@ class Comet(BaseEffect):
             ny %= h
 
         self.x, self.y = nx, ny
-        self.tail.appendleft((int(round(self.x)), int(round(self.y))))
 
-        pixels = []
-        for i, (cx, cy) in enumerate(self.tail):
-            brightness = max(0.05, (1.0 - i / len(self.tail))**2)
-            pixels.append((cx, cy, brightness))
-        self.distance += math.hypot(self.dx, self.dy)
-        return pixels
+        head = (self._head + 1) % self.tail_length
+        self._tail_x[head] = int(round(self.x))
+        self._tail_y[head] = int(round(self.y))
+        self._head = head
+        self._len = n = min(self._len + 1, self.tail_length)
+
+        tail = self._order[head, :n]
+        self.distance += self._step_dist
+        return self._tail_x[tail], self._tail_y[tail], self._fades[n, :n]
 
     def is_done(self):
         # return self.distance > self.max_distance
         return False
 
+def _ripple_kernel(dist, by_dist, sorted_dist, radius, fade, xs, ys, bs):
+    # Collect the wave-front pixels into the preallocated xs/ys/bs buffers
+    # and return how many were written. by_dist holds the flat [x, y]
+    # indices of the distance grid sorted by distance (sorted_dist), so only
+    # the band of pixels near the radius is visited rather than the grid.
+    # The band is a little wider than the front and filtered exactly below;
+    # sorting it keeps the pixels in the same x-major order as a grid scan.
+    lo = np.searchsorted(sorted_dist, radius - 1.5)
+    hi = np.searchsorted(sorted_dist, radius + 1.5)
+    band = np.sort(by_dist[lo:hi])
+
+    n = 0
+    for i in band:
+        x = i // HEIGHT
+        y = i % HEIGHT
+        # thickness of the wave front
+        delta = abs(dist[x, y] - radius)
+        if delta < 1.0:
+            xs[n] = x
+            ys[n] = y
+            # smooth bell-shaped brightness
+            bs[n] = math.cos(delta * math.pi / 2) * fade
+            n += 1
+    return n
+
+
+if njit is not None:
+    _ripple_kernel = njit(cache=True)(_ripple_kernel)
+else:
+    def _ripple_kernel(dist, by_dist, sorted_dist, radius, fade, xs, ys, bs):
+        # Same as above, computed with numpy
+        lo, hi = np.searchsorted(sorted_dist, (radius - 1.5, radius + 1.5))
+        band = np.sort(by_dist[lo:hi])
+        delta = np.abs(dist.reshape(-1)[band] - radius)
+        band = band[delta < 1.0]
+        n = len(band)
+        xs[:n], ys[:n] = np.divmod(band, dist.shape[1])
+        bs[:n] = np.cos(delta[delta < 1.0] * math.pi / 2) * fade
+        return n
+
+
 class WaveRipple(BaseEffect):
     """
     An expanding circular wave that radiates outward from a center point.
@@ -353,46 +696,130 @@ class WaveRipple(BaseEffect):
         self.radius = 0.0
         self.done = False
 
-        w, h = scrollphathd.width, scrollphathd.height
+        w, h = WIDTH, HEIGHT
 
         if self._max_radius is not None:
             self.max_radius = self._max_radius
         else:
             self.max_radius = math.hypot(w, h)
 
+        # Distance of every pixel from the centre, indexed [x, y]. It only
+        # depends on the centre and display size, so build it once here.
+        # math.hypot, as the per-pixel loop used, can differ from np.hypot
+        # in the last bit for fractional centres
+        self._dist = np.array([
+            [math.hypot(x - self.cx, y - self.cy) for y in range(h)]
+            for x in range(w)
+        ])
+
+        # Flat pixel indices ordered by distance, so each frame can bisect
+        # straight to the pixels near the wave front
+        self._by_dist = np.argsort(self._dist, axis=None, kind="stable")
+        self._sorted_dist = self._dist.reshape(-1)[self._by_dist]
+
+        # Scratch buffers _ripple_kernel writes the wave front into
+        self._front_x = np.empty(w * h, dtype=np.int16)
+        self._front_y = np.empty(w * h, dtype=np.int16)
+        self._front_b = np.empty(w * h, dtype=np.float64)
+
     def step(self):
         if self.done:
             return []
 
-        pixels = []
-        w, h = scrollphathd.width, scrollphathd.height
+        n = self._advance()
+        return list(zip(
+            self._front_x[:n].tolist(),
+            self._front_y[:n].tolist(),
+            self._front_b[:n].tolist(),
+        ))
 
-        for x in range(w):
-            for y in range(h):
-                dist = math.hypot(x - self.cx, y - self.cy)
+    def step_into(self, fb):
+        if self.done:
+            return
 
-                # thickness of the wave front
-                delta = abs(dist - self.radius)
+        n = self._advance()
+        fb[self._front_x[:n], self._front_y[:n]] = self._front_b[:n]
 
-                if delta < 1.0:
-                    # smooth bell-shaped brightness
-                    brightness = math.cos(delta * math.pi / 2)
-                    brightness *= max(0.0, 1.0 - round(self.radius) / round(self.max_radius))
+    def _advance(self):
+        """
+        Write this frame's wave front into the _front_* buffers, grow the
+        ripple, and return how many pixels were written.
+        """
+        n = 0
+        fade = max(0.0, 1.0 - round(self.radius) / round(self.max_radius))
 
-                    if brightness > 0:
-                        pixels.append((x, y, brightness))
+        if fade > 0:
+            n = _ripple_kernel(
+                self._dist, self._by_dist, self._sorted_dist, self.radius, fade,
+                self._front_x, self._front_y, self._front_b,
+            )
 
         self.radius += self.speed
 
         if round(self.radius) > round(self.max_radius):
-            ic("Ripple done",self.radius)
+            if DEBUG_EFFECTS:
+                ic("Ripple done",self.radius)
             self.done = True
 
-        return pixels
+        return n
 
     def is_done(self):
         return self.done
 
+def _box_kernel(ax, ay, r, xs, ys):
+    # Collect the pixels of the box outline with "radius" r, given
+    # |x - cx| per column and |y - cy| per row, and return how many there
+    # are. Only the outline is visited: the (at most two) edge columns are
+    # filled top to bottom, and every column inside them gets the (at most
+    # two) edge rows. Pixels come out x-major, as from a full grid scan.
+    row0 = -1
+    row1 = -1
+    for y in range(HEIGHT):
+        if ay[y] == r:
+            if row0 < 0:
+                row0 = y
+            else:
+                row1 = y
+
+    n = 0
+    for x in range(WIDTH):
+        dx = ax[x]
+        if dx == r:
+            for y in range(HEIGHT):
+                if ay[y] <= r:
+                    xs[n] = x
+                    ys[n] = y
+                    n += 1
+        elif dx < r:
+            if row0 >= 0:
+                xs[n] = x
+                ys[n] = row0
+                n += 1
+            if row1 >= 0:
+                xs[n] = x
+                ys[n] = row1
+                n += 1
+    return n
+
+
+if njit is not None:
+    _box_kernel = njit(cache=True)(_box_kernel)
+else:
+    def _box_kernel(ax, ay, r, xs, ys):
+        # Same as above, computed with numpy
+        cols = np.nonzero(ax == r)[0]
+        span = np.nonzero(ay <= r)[0]
+        inner = np.nonzero(ax < r)[0]
+        rows = np.nonzero(ay == r)[0]
+        ex = np.concatenate((np.repeat(cols, len(span)), np.repeat(inner, len(rows))))
+        ey = np.concatenate((np.tile(span, len(cols)), np.tile(rows, len(inner))))
+        order = np.lexsort((ey, ex))
+        n = len(order)
+        xs[:n] = ex[order]
+        ys[:n] = ey[order]
+        return n
+
+
 class ExpandingBox(BaseEffect):
     """
     Expanding rectangular outline from a center.
@@ -409,27 +836,33 @@ class ExpandingBox(BaseEffect):
         self.radius = 0.0
         self.done = False
 
-        w, h = scrollphathd.width, scrollphathd.height
+        w, h = WIDTH, HEIGHT
 
         if self._max_radius is not None:
             self.max_radius = self._max_radius
         else:
             self.max_radius = math.hypot(w, h)
 
+        # |x - cx| per column and |y - cy| per row
+        self._ax = np.abs(np.arange(w) - self.cx)
+        self._ay = np.abs(np.arange(h) - self.cy)
+
+        # Scratch buffers _box_kernel writes the outline into
+        self._edge_x = np.empty(w * h, dtype=np.int16)
+        self._edge_y = np.empty(w * h, dtype=np.int16)
+
     def step(self):
         if self.done:
             return []
 
-        pixels = []
-        r = self.radius
-
-        for x in range(scrollphathd.width):
-            for y in range(scrollphathd.height):
-                if (
-                    ((abs(x - self.cx) == r) and (abs(y - self.cy) <= r)) or
-                    ((abs(y - self.cy) == r) and (abs(x - self.cx) <= r))
-                ):
-                    pixels.append((x, y, 1.0))
+        # Pixels on the outline are exactly radius away from the centre
+        # along one axis and no further than radius along the other;
+        # _box_kernel only visits those, not the whole grid
+        n = _box_kernel(self._ax, self._ay, self.radius, self._edge_x, self._edge_y)
+        pixels = [
+            (x, y, 1.0)
+            for x, y in zip(self._edge_x[:n].tolist(), self._edge_y[:n].tolist())
+        ]
 
         self.radius += self.speed
 
@@ -464,14 +897,57 @@ class ScannerSweep(BaseEffect):
     def reset(self):
         self.pos = 0
         self.x_direction = 1
-        self.trail = collections.deque(maxlen=self.trail_length)
         self.done = False
 
+        # Trail line positions in a fixed ring buffer; _head is the slot of
+        # the newest line and _len how many slots are filled
+        self._lines = np.zeros(self.trail_length, np.int16)
+        self._order = _ring_order(self.trail_length)
+        self._head = -1
+        self._len = 0
+
+        # Brightness of each trail line only depends on its age, and every
+        # line covers the same run of pixels across the sweep direction
+        self._trail_b = np.array([
+            max(0.05, (1.0 - i / self.trail_length) ** 2)
+            for i in range(self.trail_length)
+        ])
+        self._across = np.arange(HEIGHT if self.horizontal else WIDTH)
+
     def step(self):
         if self.done:
             return []
 
-        w, h = scrollphathd.width, scrollphathd.height
+        lines, bs = self._advance()
+
+        # Every line lights the whole column (or row) it sits on
+        across = len(self._across)
+        along = np.repeat(lines, across)
+        side = np.tile(self._across, len(lines))
+        bs = np.repeat(bs, across)
+
+        if self.horizontal:
+            xs, ys = along, side
+        else:
+            xs, ys = side, along
+        return list(zip(xs.tolist(), ys.tolist(), bs.tolist()))
+
+    def step_into(self, fb):
+        if self.done:
+            return
+
+        lines, bs = self._advance()
+
+        # Fill whole columns (or rows) at once; older lines are written last
+        # and win where they overlap, as with the tuple list
+        if not self.horizontal:
+            fb = fb.T
+        on = (lines >= 0) & (lines < fb.shape[0])
+        fb[lines[on]] = bs[on, None]
+
+    def _advance(self):
+        """Move the scanner and return the trail's line positions and brightness, newest first."""
+        w, h = WIDTH, HEIGHT
 
         # move scanner
         self.pos += self.x_direction * self.speed
@@ -487,21 +963,12 @@ class ScannerSweep(BaseEffect):
                 self.pos = 0
                 self.done = True
 
-        self.trail.appendleft(int(self.pos))
-
-        pixels = []
-
-        for i, p in enumerate(self.trail):
-            brightness = max(0.05, (1.0 - i / self.trail_length) ** 2)
-
-            if self.horizontal:
-                for y in range(h):
-                    pixels.append((p, y, brightness))
-            else:
-                for x in range(w):
-                    pixels.append((x, p, brightness))
+        head = (self._head + 1) % self.trail_length
+        self._lines[head] = int(self.pos)
+        self._head = head
+        self._len = n = min(self._len + 1, self.trail_length)
 
-        return pixels
+        return self._lines[self._order[head, :n]], self._trail_b[:n]
 
     def is_done(self):
         return self.done
@@ -521,29 +988,59 @@ class ZigZagSweep(BaseEffect):
         self.reset()
 
     def reset(self):
-        self.w = scrollphathd.width
-        self.h = scrollphathd.height
+        self.w = WIDTH
+        self.h = HEIGHT
 
         self.row = 0
         self.col = 0
         self.x_direction = 1   # +1 → right, -1 → left
         self.y_direction = 1   # +1 → down, -1 → up
-
-        self.trail = collections.deque(maxlen=self.trail_length)
         self.done = False
 
+        # Trail positions in a fixed ring buffer; _head is the slot of the
+        # newest entry and _len how many slots are filled. A fractional
+        # speed gives fractional columns, so only integer speeds get an
+        # integer column buffer.
+        col_type = np.int16 if isinstance(self.speed, int) else np.float64
+        self._trail_x = np.zeros(self.trail_length, col_type)
+        self._trail_y = np.zeros(self.trail_length, np.int16)
+        self._order = _ring_order(self.trail_length)
+        self._head = -1
+        self._len = 0
+
+        # Brightness of each trail entry only depends on its age
+        self._trail_b = np.array([
+            max(0.05, (1.0 - i / self.trail_length) ** 2)
+            for i in range(self.trail_length)
+        ])
+
     def step(self):
         if self.done:
             return []
 
-        pixels = []
+        xs, ys, bs = self._advance()
+        return list(zip(xs.tolist(), ys.tolist(), bs.tolist()))
+
+    def step_into(self, fb):
+        if self.done:
+            return
 
+        xs, ys, bs = self._advance()
+
+        w, h = fb.shape
+        # fractional columns never land on a pixel
+        on = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h) & (xs % 1 == 0)
+        fb[xs[on].astype(np.intp), ys[on]] = bs[on]
+
+    def _advance(self):
+        """Move the point and return the trail's x, y and brightness arrays, newest first."""
         # Move horizontally
         self.col += self.x_direction * self.speed
 
         # Hit left/right edge?
         if self.col < 0 or self.col >= self.w:
-            ic("row change", self.row, self.x_direction)
+            if DEBUG_EFFECTS:
+                ic("row change", self.row, self.x_direction)
             # Clamp column
             self.col = max(0, min(self.w - 1, self.col))
 
@@ -555,7 +1052,8 @@ class ZigZagSweep(BaseEffect):
 
             # Hit top/bottom?
             if self.row < 0 or self.row >= self.h:
-                ic("Reverse vertical", self.row, self.y_direction)
+                if DEBUG_EFFECTS:
+                    ic("Reverse vertical", self.row, self.y_direction)
                 if self.bounce:
                     # Clamp row
                     self.row = max(0, min(self.h - 1, self.row))
@@ -565,13 +1063,14 @@ class ZigZagSweep(BaseEffect):
                 else:
                     self.done = True
 
-        self.trail.appendleft((self.col, self.row))
-
-        for i, (x, y) in enumerate(self.trail):
-            brightness = max(0.05, (1.0 - i / self.trail_length) ** 2)
-            pixels.append((x, y, brightness))
+        head = (self._head + 1) % self.trail_length
+        self._trail_x[head] = self.col
+        self._trail_y[head] = self.row
+        self._head = head
+        self._len = n = min(self._len + 1, self.trail_length)
 
-        return pixels
+        trail = self._order[head, :n]
+        return self._trail_x[trail], self._trail_y[trail], self._trail_b[:n]
 
     def is_done(self):
         return self.done
@@ -589,11 +1088,25 @@ class PulseFade(BaseEffect):
     def reset(self):
         self.phase = 0.0
         self.done = False
+        # Every pixel, x-major, for step() to pair with this frame's brightness
+        self._coords = [(x, y) for x in range(WIDTH) for y in range(HEIGHT)]
 
     def step(self):
         if self.done:
             return []
 
+        brightness = self._advance()
+        return [(x, y, brightness) for x, y in self._coords]
+
+    def step_into(self, fb):
+        if self.done:
+            return
+
+        # The whole display shares one brightness
+        fb.fill(self._advance())
+
+    def _advance(self):
+        """Advance the pulse one step and return this frame's brightness."""
         brightness = (math.sin(self.phase) + 1.0) / 2.0
         self.phase += self.speed
 
@@ -603,12 +1116,7 @@ class PulseFade(BaseEffect):
             else:
                 self.done = True
 
-        pixels = []
-        for x in range(scrollphathd.width):
-            for y in range(scrollphathd.height):
-                pixels.append((x, y, brightness))
-
-        return pixels
+        return brightness
 
     def is_done(self):
         return self.done
@@ -628,7 +1136,7 @@ class SpiralSweep(BaseEffect):
         self.angle = 0.0
         self.radius = 0.0
         self.done = False
-        self.max_radius = math.hypot(scrollphathd.width, scrollphathd.height)
+        self.max_radius = math.hypot(WIDTH, HEIGHT)
 
     def step(self):
         if self.done:
@@ -643,7 +1151,7 @@ class SpiralSweep(BaseEffect):
         if self.radius > self.max_radius:
             self.done = True
 
-        if 0 <= x < scrollphathd.width and 0 <= y < scrollphathd.height:
+        if 0 <= x < WIDTH and 0 <= y < HEIGHT:
             return [(x, y, 1.0)]
 
         return []
@@ -651,6 +1159,35 @@ class SpiralSweep(BaseEffect):
     def is_done(self):
         return self.done
 
+@lru_cache(maxsize=8)
+def _load_anim(filename, mtime):
+    """
+    Decode a baked animation once and share it between BakedAnimations.
+
+    `mtime` is only part of the cache key, so re-baking a file replaces
+    the cached copy. Returns the frames as tuples of (x, y, b) tuples,
+    plus each frame drawn into a read-only [frame, x, y] brightness
+    tensor and a matching mask of which pixels it lights.
+    """
+    import json, gzip
+
+    with gzip.open(filename, "rt", encoding="utf-8") as f:
+        data = json.load(f)
+
+    frames = tuple(tuple(tuple(p) for p in frame) for frame in data["frames"])
+
+    tensor = np.zeros((len(frames), WIDTH, HEIGHT))
+    lit = np.zeros((len(frames), WIDTH, HEIGHT), dtype=bool)
+    for i, frame in enumerate(frames):
+        if frame:
+            xs, ys, bs = _pixel_arrays(frame, WIDTH, HEIGHT)
+            tensor[i, xs, ys] = bs
+            lit[i, xs, ys] = True
+
+    tensor.flags.writeable = False
+    lit.flags.writeable = False
+    return frames, tensor, lit
+
 class BakedAnimation(BaseEffect):
     """
     Plays back a pre-recorded animation from a compressed file.
@@ -668,12 +1205,10 @@ class BakedAnimation(BaseEffect):
         self.reset()
 
     def reset(self):
-        import json, gzip
-
-        with gzip.open(self.filename, "rt", encoding="utf-8") as f:
-            data = json.load(f)
-
-        self.frames = data["frames"]
+        # Decoded once per file, not on every reset
+        self.frames, self._tensor, self._lit = _load_anim(
+            self.filename, os.path.getmtime(self.filename)
+        )
         self.index = 0
         self.done = False
 
@@ -681,7 +1216,20 @@ class BakedAnimation(BaseEffect):
         if self.done:
             return []
 
-        frame = self.frames[self.index]
+        frame = list(self.frames[self.index])
+        self._advance()
+        return frame
+
+    def step_into(self, fb):
+        if self.done:
+            return
+
+        lit = self._lit[self.index]
+        fb[lit] = self._tensor[self.index][lit]
+        self._advance()
+
+    def _advance(self):
+        """Move on to the next frame, looping or finishing at the end."""
         self.index += 1
 
         if self.index >= len(self.frames):
@@ -690,8 +1238,6 @@ class BakedAnimation(BaseEffect):
             else:
                 self.done = True
 
-        return frame
-
     def is_done(self):
         return self.done
 
@@ -705,8 +1251,60 @@ class Scene(BaseEffect):
             pixels.extend(e.step())
         return pixels
 
+    def step_into(self, fb):
+        # Each effect draws over the ones before it, same as the list order
+        for e in self.effects:
+            e.step_into(fb)
+
 ###------------------------------------------------------------------------###
 # Pac Man, Pellet, and Ghost animation and scene logic
+def _pacman_kernel(px, py, radius, mouth_angle, dir_angle, x0, x1, y0, y1, xs, ys):
+    # Collect the lit pixels of a Pac-Man centred on (px, py) within the
+    # box x0..x1, y0..y1 (inclusive) and return how many there are
+    n = 0
+    for ix in range(x0, x1 + 1):
+        for iy in range(y0, y1 + 1):
+            # Sample at pixel center
+            dx = ix + 0.5 - px
+            dy = iy + 0.5 - py
+            dist = math.hypot(dx, dy)
+
+            # Solid filled body
+            if dist > radius:
+                continue
+
+            angle = math.atan2(dy, dx)
+
+            # Relative angle to direction
+            rel = (angle - dir_angle + math.pi * 3) % (2 * math.pi) - math.pi
+
+            # Mouth cutout (hard, stable)
+            if abs(rel) < mouth_angle:
+                continue
+
+            xs[n] = ix
+            ys[n] = iy
+            n += 1
+    return n
+
+
+if njit is not None:
+    _pacman_kernel = njit(cache=True)(_pacman_kernel)
+else:
+    def _pacman_kernel(px, py, radius, mouth_angle, dir_angle, x0, x1, y0, y1, xs, ys):
+        # Same as above, computed with numpy
+        gx, gy = np.meshgrid(np.arange(x0, x1 + 1), np.arange(y0, y1 + 1), indexing="ij")
+        dx = gx + 0.5 - px
+        dy = gy + 0.5 - py
+        dist = np.hypot(dx, dy)
+        rel = (np.arctan2(dy, dx) - dir_angle + math.pi * 3) % (2 * math.pi) - math.pi
+        fx, fy = np.nonzero((dist <= radius) & ~(np.abs(rel) < mouth_angle))
+        n = len(fx)
+        xs[:n] = gx[fx, fy]
+        ys[:n] = gy[fx, fy]
+        return n
+
+
 class PacMan(BaseEffect):
     """
     Animated Pac-Man character with a smooth chomping mouth.
@@ -747,11 +1345,34 @@ class PacMan(BaseEffect):
         self.phase = 0.0
         self.done = False
 
+        # Scratch buffers _pacman_kernel writes the body pixels into
+        w, h = WIDTH, HEIGHT
+        self._body_x = np.empty(w * h, dtype=np.int16)
+        self._body_y = np.empty(w * h, dtype=np.int16)
+
     def step(self):
         if self.done:
             return []
 
-        w, h = scrollphathd.width, scrollphathd.height
+        n = self._advance()
+        return [
+            (x, y, 1.0)
+            for x, y in zip(self._body_x[:n].tolist(), self._body_y[:n].tolist())
+        ]
+
+    def step_into(self, fb):
+        if self.done:
+            return
+
+        n = self._advance()
+        fb[self._body_x[:n], self._body_y[:n]] = 1.0
+
+    def _advance(self):
+        """
+        Move and chomp one frame, write the visible body pixels into the
+        _body_* buffers, and return how many were written.
+        """
+        w, h = WIDTH, HEIGHT
 
         # Move (subpixel, but stable)
         self.x += self.dx
@@ -763,7 +1384,7 @@ class PacMan(BaseEffect):
         else:
             if not (0 <= self.x < w and 0 <= self.y < h):
                 self.done = True
-                return []
+                return 0
 
         # Chomp animation (clearly visible)
         self.phase += self.chomp_speed
@@ -773,44 +1394,17 @@ class PacMan(BaseEffect):
         # Direction Pac-Man is facing
         dir_angle = math.atan2(self.dy, self.dx)
 
-        pixels = []
-
-        # Tight bounding box (reduces flicker)
+        # Tight bounding box (reduces flicker), clipped to the display
         xmin = int(self.x - self.radius - 1)
         xmax = int(self.x + self.radius + 1)
         ymin = int(self.y - self.radius - 1)
         ymax = int(self.y + self.radius + 1)
 
-        for ix in range(xmin, xmax + 1):
-            for iy in range(ymin, ymax + 1):
-                if not (0 <= ix < w and 0 <= iy < h):
-                    continue
-
-                # Sample at pixel center
-                dx = ix + 0.5 - self.x
-                dy = iy + 0.5 - self.y
-                dist = math.hypot(dx, dy)
-
-                # Solid filled body
-                if dist > self.radius:
-                    continue
-
-                angle = math.atan2(dy, dx)
-
-                # Relative angle to direction
-                rel = (angle - dir_angle + math.pi * 3) % (2 * math.pi) - math.pi
-
-                # Mouth cutout (hard, stable)
-                if abs(rel) < mouth_angle:
-                    continue
-
-                b = 1.0
-                if dist > self.radius - 0.6:
-                    b = clamp01(self.radius - dist + 0.6)
-                
-                pixels.append((ix, iy, 1.0))
-
-        return pixels
+        return _pacman_kernel(
+            self.x, self.y, self.radius, mouth_angle, dir_angle,
+            max(xmin, 0), min(xmax, w - 1), max(ymin, 0), min(ymax, h - 1),
+            self._body_x, self._body_y,
+        )
 
     def is_done(self):
         return self.done
@@ -827,7 +1421,7 @@ class PelletRow(BaseEffect):
         self.reset()
 
     def reset(self):
-        self.pellets = {x for x in range(0,scrollphathd.width,3)}
+        self.pellets = {x for x in range(0,WIDTH,3)}
         self.done = False
 
     def eat(self, x):
@@ -839,6 +1433,37 @@ class PelletRow(BaseEffect):
     def is_done(self):
         return self.done
 
+def _ghost_offsets(bump_phase):
+    """
+    (dx, dy) offsets of every ghost pixel from its centre, in drawing order,
+    for one of the two frames of its feet animation.
+    """
+    offsets = []
+
+    # --- Head (semi-circle) ---
+    head_radius = 2
+
+    for dx in range(-head_radius, head_radius + 1):
+        for dy in range(-head_radius, 1):
+            if dx * dx + dy * dy <= head_radius * head_radius:
+                offsets.append((dx, dy))
+
+    # --- Body ---
+    body_height = 3
+    body_width = 2
+
+    for dx in range(-body_width, body_width + 1):
+        for dy in range(1, body_height + 1):
+            offsets.append((dx, dy))
+
+    # --- Bumpy bottom (animated) ---
+    for i, dx in enumerate([-2, 0, 2]):
+        if (i + bump_phase) % 2 == 0:
+            offsets.append((dx, body_height + 1))
+
+    dxs, dys = zip(*offsets)
+    return np.array(dxs), np.array(dys)
+
 class Ghost(BaseEffect):
     """
     Pac-Man style ghost with animated feet.
@@ -846,6 +1471,11 @@ class Ghost(BaseEffect):
     Moves horizontally across the display and completes once fully
     off-screen.
     """
+
+    # The ghost's shape never changes, only where it is and which way its
+    # feet are, so its pixel offsets are built once for both foot frames
+    _offsets = (_ghost_offsets(0), _ghost_offsets(1))
+
     def __init__(self, x, y, x_speed=0.15):
         self.start_x = x
         self.y = y
@@ -858,53 +1488,34 @@ class Ghost(BaseEffect):
         self.done = False
 
     def step(self):
+        if not self._advance():
+            return []
+
+        xs, ys = self._visible()
+        return [(x, y, 0.6) for x, y in zip(xs.tolist(), ys.tolist())]
+
+    def step_into(self, fb):
+        if self._advance():
+            fb[self._visible()] = 0.6
+
+    def _advance(self):
+        """Move the ghost one step; returns False once it has left the display."""
         self.x += self.x_speed
         self.phase += 1
 
-        if self.x >= scrollphathd.width + 4:
+        if self.x >= WIDTH + 4:
             self.done = True
-            return []
+            return False
+        return True
 
-        pixels = []
-        w, h = scrollphathd.width, scrollphathd.height
-
-        cx = int(round(self.x))
-        cy = int(round(self.y))
-
-        # --- Head (semi-circle) ---
-        head_radius = 2
-
-        for dx in range(-head_radius, head_radius + 1):
-            for dy in range(-head_radius, 1):
-                if dx * dx + dy * dy <= head_radius * head_radius:
-                    px = cx + dx
-                    py = cy + dy
-                    if 0 <= px < w and 0 <= py < h:
-                        pixels.append((px, py, 0.6))
-
-        # --- Body ---
-        body_height = 3
-        body_width = 2
-
-        for dx in range(-body_width, body_width + 1):
-            for dy in range(1, body_height + 1):
-                px = cx + dx
-                py = cy + dy
-                if 0 <= px < w and 0 <= py < h:
-                    pixels.append((px, py, 0.6))
-
-        # --- Bumpy bottom (animated) ---
-        bump_y = cy + body_height + 1
-        bump_phase = self.phase % 2
-
-        for i, dx in enumerate([-2, 0, 2]):
-            if (i + bump_phase) % 2 == 0:
-                px = cx + dx
-                py = bump_y
-                if 0 <= px < w and 0 <= py < h:
-                    pixels.append((px, py, 0.6))
+    def _visible(self):
+        """x and y arrays of the ghost's pixels that are on the display."""
+        dxs, dys = self._offsets[self.phase % 2]
+        xs = dxs + int(round(self.x))
+        ys = dys + int(round(self.y))
 
-        return pixels
+        on = (xs >= 0) & (xs < WIDTH) & (ys >= 0) & (ys < HEIGHT)
+        return xs[on], ys[on]
 
     def is_done(self):
         return self.done
@@ -921,6 +1532,9 @@ class PacManScene(BaseEffect):
         self.pellets = pellets
         self.pacman = pacman
         self.ghost = ghost
+        # Pac-Man moves before the pellets are drawn but is drawn on top of
+        # them, so step_into renders him here first (NaN = not drawn)
+        self._pacman_frame = np.empty((WIDTH, HEIGHT))
         self.reset()
 
     def reset(self):
@@ -938,11 +1552,25 @@ class PacManScene(BaseEffect):
         pixels += self.ghost.step()
         pixels += pacman_pixels
 
-        if self.pacman.x > scrollphathd.width + 4:
+        if self.pacman.x > WIDTH + 4:
             self.done = True
 
         return pixels
 
+    def step_into(self, fb):
+        pacman = self._pacman_frame
+        pacman.fill(np.nan)
+        self.pacman.step_into(pacman)
+        self.pellets.eat(self.pacman.x)
+
+        self.pellets.step_into(fb)
+        self.ghost.step_into(fb)
+        drawn = ~np.isnan(pacman)
+        fb[drawn] = pacman[drawn]
+
+        if self.pacman.x > WIDTH + 4:
+            self.done = True
+
     def is_done(self):
         return self.done
 
@@ -974,6 +1602,14 @@ class BufferEffect(BaseEffect):
         """
         raise NotImplementedError
 
+    def step_into(self, fb):
+        """Capture what step() draws through scrollphathd.set_pixel into fb."""
+        with capture_pixels() as drawn:
+            self.step()
+
+        lit = drawn > 0
+        fb[lit] = drawn[lit]
+
     def render(self):
         scrollphathd.clear()
         self.step()
@@ -997,6 +1633,12 @@ class StaticText(BufferEffect):
             brightness=self.brightness
         )
 
+    def step_into(self, fb):
+        # Same pixels as step(), from the cached rasterization
+        text = rasterize_string(self.text, x=self.x, y=self.y, brightness=self.brightness)
+        lit = text > 0
+        fb[lit] = text[lit]
+
 class CameraScroll:
     """
     Camera scroll mixin for buffer-native effects.
@@ -1122,7 +1764,6 @@ class MyEffect(BaseEffect):
 ###-------------------------------------------------------------------------------###
 # Run an effect and display on the matrix in realtime
 import time
-import scrollphathd
 
 
 class EffectRunner:
@@ -1149,6 +1790,19 @@ class EffectRunner:
 
     def run(self, frames: int | None = None):
         count = 0
+        frame = np.zeros((WIDTH, HEIGHT))
+        # Whether the last frame shown was blank; whatever is on the
+        # display now, the first frame is always drawn
+        shown_blank = False
+
+        # Frames are written into the copy of the buffer that show() hands to
+        # before_display, so on the step_into path the buffer itself stays
+        # blank and only needs clearing once
+        scrollphathd.clear()
+
+        # Frames are paced against a monotonic deadline, so the time spent in
+        # step()/show() comes out of the frame delay instead of adding to it
+        deadline = time.monotonic()
 
         while frames is None or count < frames:
             # NEW: buffer-native path
@@ -1158,24 +1812,42 @@ class EffectRunner:
                 self.effect.step()  # effect draws directly
 
                 scrollphathd.show()
-                time.sleep(self.delay)
-                count += 1
-                continue
-
-            frame_pixels = {(x, y): b for x, y, b in self.effect.step()}
-            
-            scrollphathd.clear()
+            else:
+                frame.fill(0.0)
+                self.effect.step_into(frame)
+
+                # Nothing drawn and the display already showing a blank
+                # frame (e.g. a finished ripple): skip the redraw
+                blank = not frame.any()
+                if not (blank and shown_blank):
+                    # Invert and clamp the whole frame in place (same as
+                    # clamp01 per pixel); apply_transformation works on
+                    # arrays as well
+                    np.abs(self.apply_transformation(frame), out=frame)
+                    np.minimum(frame, 1.0, out=frame)
+
+                    self._display(frame)
+                shown_blank = blank
+
+            deadline += self.delay
+            sleep_for = deadline - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            elif sleep_for < -self.delay:
+                # More than a frame behind: restart the schedule rather
+                # than rushing through frames to catch up
+                deadline = time.monotonic()
+            count += 1
 
-            for x in range(scrollphathd.width):
-                for y in range(scrollphathd.height):
-                    b = frame_pixels.get((x, y), 0.0)
-                    b = self.apply_transformation(b)
-                    b = clamp01(b)
-                    scrollphathd.set_pixel(x, y, b)
+    def _display(self, frame):
+        """Show frame by copying it over the whole display in one assignment."""
+        def paint(buffer):
+            w = min(buffer.shape[0], frame.shape[0])
+            h = min(buffer.shape[1], frame.shape[1])
+            buffer[:w, :h] = frame[:w, :h]
+            return buffer
 
-            scrollphathd.show()
-            time.sleep(self.delay)
-            count += 1
+        scrollphathd.show(before_display=paint)
 
 ###-------------------------------------------------------------------------------###
 # AnimationRecorder a replacement for the EffectRunner Class that saves frames to a file to be read from later.
@@ -1221,8 +1893,8 @@ class AnimationRecorder:
     def save(self, filename: str):
         data = {
             "version": 1,
-            "width": scrollphathd.width,
-            "height": scrollphathd.height,
+            "width": WIDTH,
+            "height": HEIGHT,
             "fps": self.fps,
             "frame_count": len(self.frames),
             "frames": self.frames,
@@ -1267,6 +1939,7 @@ def demo_all_effects(fps: float = 25, frames_per_demo: int = 150):
         ("SpiralSweep", SpiralSweep(cx=8, cy=3, speed=1)),
         ("Sparkle", Sparkle(randint(0, scrollphathd.width-1),
                             randint(0, scrollphathd.height-1))),
+        ("SparkleField", SparkleField(density=30)),
         ("Comet", Comet(0, 0, dx=1, dy=1, tail_length=6, bounce=True)),
         ("WaveRipple", WaveRipple(scrollphathd.width//2, scrollphathd.height//2, speed=0.7)),
         ("ScannerSweep", ScannerSweep(horizontal=True, speed=1, trail_length=6, bounce=True)),
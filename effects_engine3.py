@@ -30,32 +30,56 @@ from abc import ABC, abstractmethod
 from typing import Protocol, Iterator
 from contextlib import contextmanager
 
+import numpy as np
+
 try:
     from icecream import ic
 except ImportError:
     ic = lambda *a: a[0] if len(a) == 1 else a
 
+# Numba is optional: when installed, per-pixel kernels are compiled,
+# otherwise equivalent numpy versions are used
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 import scrollphathd
 from scrollphathd.fonts import font3x5
 
+# The panel never changes size, so read its dimensions once instead of
+# looking them up on the scrollphathd module every frame
+WIDTH, HEIGHT = scrollphathd.width, scrollphathd.height
+
 # ============================================================================
 # UTILITIES
 # ============================================================================
 
 def clamp01(v: float) -> float:
-    """Clamp value to [0.0, 1.0] range."""
-    return max(0.0, min(1.0, abs(v)))
+    """Clamp value to [0.0, 1.0] range (negative values are mirrored)."""
+    # Plain comparisons rather than abs()/min()/max() calls; NaN still
+    # comes out as 1.0, as it did with min(1.0, ...)
+    if v < 0.0:
+        v = -v
+    return v if v <= 1.0 else 1.0
 
 
 @contextmanager
 def capture_pixels():
-    """Capture pixels written by scrollphathd drawing commands."""
-    captured = {}
+    """
+    Capture pixels written by scrollphathd drawing commands.
+    
+    Yields a brightness array indexed [x, y] the size of the display. A
+    pixel drawn more than once keeps its brightest value; pixels off the
+    display are dropped.
+    """
+    w, h = WIDTH, HEIGHT
+    captured = np.zeros((w, h))
     original = scrollphathd.set_pixel
 
     def intercept(x, y, b):
-        if b > 0:
-            captured[(x, y)] = max(captured.get((x, y), 0.0), b)
+        if b > 0 and 0 <= x < w and 0 <= y < h and b > captured[x, y]:
+            captured[x, y] = b
 
     scrollphathd.set_pixel = intercept
     try:
@@ -109,6 +133,131 @@ def blend_pixel(dst: float, src: float, mode: BlendMode, opacity: float = 1.0) -
     return src
 
 
+# Vectorized blends, one per BlendMode. Each takes the destination and
+# source brightness arrays plus the layer opacity, updates dst in place
+# and returns it; element for element they give what blend_pixel() does.
+# fmax/fmin match Python's max()/min() when a source value is NaN.
+
+def _blend_replace(dst, src, opacity):
+    src = src * opacity
+    np.copyto(dst, src, where=src > 0)
+    return dst
+
+def _blend_max(dst, src, opacity):
+    return np.fmax(dst, src * opacity, out=dst)
+
+def _blend_add(dst, src, opacity):
+    dst += src * opacity
+    return np.fmin(1.0, dst, out=dst)
+
+def _blend_multiply(dst, src, opacity):
+    dst *= src * opacity
+    return dst
+
+def _blend_screen(dst, src, opacity):
+    inv = 1.0 - dst
+    inv *= 1.0 - src * opacity
+    return np.subtract(1.0, inv, out=dst)
+
+def _blend_alpha(dst, src, opacity):
+    dst *= 1.0 - opacity
+    dst += src * opacity
+    return dst
+
+def _blend_source(dst, src, opacity):
+    np.multiply(src, opacity, out=dst)
+    return dst
+
+_BLEND_DISPATCH = {
+    BlendMode.REPLACE: _blend_replace,
+    BlendMode.MAX: _blend_max,
+    BlendMode.ADD: _blend_add,
+    BlendMode.MULTIPLY: _blend_multiply,
+    BlendMode.SCREEN: _blend_screen,
+    BlendMode.ALPHA: _blend_alpha,
+}
+
+
+def blend_arrays(dst: np.ndarray, src: np.ndarray, mode: BlendMode, opacity: float = 1.0) -> np.ndarray:
+    """
+    Blend arrays of source pixels onto destination pixels.
+
+    Element-wise equivalent of blend_pixel(), so a whole layer can be
+    blended in a few numpy operations. dst (a float array) is updated in
+    place and returned.
+    """
+    return _BLEND_DISPATCH.get(mode, _blend_source)(dst, src, opacity)
+
+
+def _make_blend(mode: BlendMode, opacity: float):
+    """
+    Return blend(dst, src) for one mode and opacity, with the opacity
+    folded in: at full opacity the source is used as is, and for ALPHA
+    the destination weight is worked out once. Gives the same result as
+    blend_arrays(dst, src, mode, opacity).
+    """
+    if mode == BlendMode.ALPHA:
+        keep = 1.0 - opacity
+        
+        def blend(dst, src):
+            dst *= keep
+            dst += src * opacity
+            return dst
+        
+        return blend
+    
+    base = _BLEND_DISPATCH.get(mode, _blend_source)
+    if opacity != 1.0:
+        return lambda dst, src: base(dst, src, opacity)
+    
+    # Full opacity: src * 1.0 == src, so skip the multiply
+    if mode == BlendMode.REPLACE:
+        def blend(dst, src):
+            np.copyto(dst, src, where=src > 0)
+            return dst
+    elif mode == BlendMode.MAX:
+        def blend(dst, src):
+            return np.fmax(dst, src, out=dst)
+    elif mode == BlendMode.ADD:
+        def blend(dst, src):
+            dst += src
+            return np.fmin(1.0, dst, out=dst)
+    elif mode == BlendMode.MULTIPLY:
+        def blend(dst, src):
+            dst *= src
+            return dst
+    elif mode == BlendMode.SCREEN:
+        def blend(dst, src):
+            inv = 1.0 - dst
+            inv *= 1.0 - src
+            return np.subtract(1.0, inv, out=dst)
+    else:
+        def blend(dst, src):
+            np.copyto(dst, src)
+            return dst
+    
+    return blend
+
+
+def pixel_arrays(pixels, w: int, h: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Split (x, y, brightness) pixels into x, y and brightness arrays,
+    dropping any that don't land on a w x h display.
+    """
+    if not len(pixels):
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty, np.empty(0)
+
+    xs, ys, bs = zip(*pixels)
+    xs = np.array(xs, dtype=np.float64)
+    ys = np.array(ys, dtype=np.float64)
+    bs = np.array(bs, dtype=np.float64)
+
+    # Non-integer coordinates can't be shown either
+    on = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h) & (xs % 1 == 0) & (ys % 1 == 0)
+    return xs[on].astype(np.intp), ys[on].astype(np.intp), bs[on]
+
+
 # ============================================================================
 # CORE ABSTRACTIONS
 # ============================================================================
@@ -119,6 +268,7 @@ class Effect(ABC):
     
     Contract:
         - step() advances one frame and returns pixel data
+        - step_arrays() does the same, returning the pixels as arrays
         - reset() restores initial state
         - is_done() indicates completion
     """
@@ -133,6 +283,22 @@ class Effect(ABC):
         """
         pass
     
+    def step_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Advance one frame.
+        
+        The compositor and runner call this instead of step() so whole
+        frames stay in numpy. The default converts the output of step();
+        effects that build their pixels as arrays override it and derive
+        step() from it instead, skipping the per-pixel tuples.
+        
+        Returns:
+            x, y and brightness arrays for the pixels that land on the
+            display, in step() order. They may be views of the effect's
+            own buffers, only valid until its next step.
+        """
+        return pixel_arrays(self.step(), WIDTH, HEIGHT)
+    
     def reset(self):
         """Reset to initial state."""
         pass
@@ -142,6 +308,11 @@ class Effect(ABC):
         return False
 
 
+def _pixel_list(xs: np.ndarray, ys: np.ndarray, bs: np.ndarray) -> list[tuple[int, int, float]]:
+    """Turn x, y and brightness arrays back into (x, y, brightness) tuples."""
+    return list(zip(xs.tolist(), ys.tolist(), bs.tolist()))
+
+
 class Layer:
     """
     Wraps an effect with rendering properties.
@@ -151,6 +322,7 @@ class Layer:
         blend_mode: How to blend with underlying layers
         opacity: Layer transparency [0.0, 1.0]
         visible: Whether layer is rendered
+        paused: Whether to hold the last frame instead of stepping the effect
     """
     
     def __init__(
@@ -158,18 +330,51 @@ class Layer:
         effect: Effect,
         blend_mode: BlendMode = BlendMode.MAX,
         opacity: float = 1.0,
-        visible: bool = True
+        visible: bool = True,
+        paused: bool = False
     ):
         self.effect = effect
-        self.blend_mode = blend_mode
-        self.opacity = clamp01(opacity)
+        self._blend_mode = blend_mode
+        self._opacity = clamp01(opacity)
+        self.blend = _make_blend(self._blend_mode, self._opacity)
         self.visible = visible
+        self.paused = paused
+        # Pixel arrays from the last effect step, replayed while paused
+        self._last_pixels: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+    
+    # blend(dst, src) is specialised for the current mode and opacity, so
+    # it is rebuilt whenever either changes
+    
+    @property
+    def blend_mode(self) -> BlendMode:
+        return self._blend_mode
+    
+    @blend_mode.setter
+    def blend_mode(self, mode: BlendMode):
+        self._blend_mode = mode
+        self.blend = _make_blend(mode, self._opacity)
+    
+    @property
+    def opacity(self) -> float:
+        return self._opacity
+    
+    @opacity.setter
+    def opacity(self, opacity: float):
+        self._opacity = opacity
+        self.blend = _make_blend(self._blend_mode, opacity)
     
     def step(self) -> list[tuple[int, int, float]]:
-        """Get pixels from effect if visible."""
+        """Get pixels from effect if visible, or its last frame if paused."""
+        return _pixel_list(*self.step_arrays())
+    
+    def step_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Same as step(), as x, y and brightness arrays."""
         if not self.visible:
-            return []
-        return self.effect.step()
+            return pixel_arrays([], WIDTH, HEIGHT)
+        if self.paused and self._last_pixels is not None:
+            return self._last_pixels
+        self._last_pixels = self.effect.step_arrays()
+        return self._last_pixels
 
 
 # ============================================================================
@@ -186,6 +391,12 @@ class Compositor:
     
     def __init__(self):
         self.layers: list[Layer] = []
+
+        # Composite brightness per pixel, indexed [x, y], and which pixels
+        # any layer drew this frame (a layer can draw a pixel at 0.0)
+        w, h = WIDTH, HEIGHT
+        self._dst = np.zeros((w, h))
+        self._lit = np.zeros((w, h), dtype=bool)
     
     def add_layer(
         self,
@@ -206,38 +417,68 @@ class Compositor:
         """Remove all layers."""
         self.layers.clear()
     
-    def composite(self) -> dict[tuple[int, int], float]:
+    def composite(self) -> np.ndarray:
         """
         Render all layers and return final pixel buffer.
         
         Returns:
-            Dictionary mapping (x, y) -> brightness
+            Array of brightness indexed [x, y]; pixels no layer drew are 0.0.
+            The array is reused by the next call.
         """
-        buffer = {}
+        dst, lit = self._dst, self._lit
+        dst.fill(0.0)
+        lit.fill(False)
+        w, h = dst.shape
+        flat = dst.reshape(-1)
         
         for layer in self.layers:
+            # Hidden layers draw nothing, and paused ones replay their last
+            # frame without stepping, so neither needs its effect checked
+            if not layer.visible:
+                continue
+            
             # Auto-reset finished effects for looping
-            if layer.effect.is_done():
+            if not layer.paused and layer.effect.is_done():
                 layer.effect.reset()
             
-            pixels = layer.step()
+            xs, ys, bs = layer.step_arrays()
+            if not len(xs):
+                continue
+            idx = xs * h + ys
+            lit.reshape(-1)[idx] = True
             
-            for x, y, brightness in pixels:
-                key = (x, y)
-                dst = buffer.get(key, 0.0)
-                buffer[key] = blend_pixel(
-                    dst,
-                    brightness,
-                    layer.blend_mode,
-                    layer.opacity
-                )
-        
-        return buffer
+            blend = layer.blend
+            
+            # Most layers draw each pixel at most once, so blend them
+            # straight into the canvas in one go
+            if np.bincount(idx, minlength=w * h).max() == 1:
+                flat[idx] = blend(flat[idx], bs)
+                continue
+            
+            # A layer can draw the same pixel more than once; blend the first
+            # occurrence of every pixel, then the next, and so on, so repeats
+            # blend in the order they were drawn
+            while len(idx):
+                first_idx, first = np.unique(idx, return_index=True)
+                flat[first_idx] = blend(flat[first_idx], bs[first])
+                if len(first) == len(idx):
+                    break
+                
+                rest = np.ones(len(idx), dtype=bool)
+                rest[first] = False
+                idx, bs = idx[rest], bs[rest]
+        
+        return dst
     
     def step(self) -> list[tuple[int, int, float]]:
         """Step all layers and return composited pixels."""
-        buffer = self.composite()
-        return [(x, y, b) for (x, y), b in buffer.items()]
+        return _pixel_list(*self.step_arrays())
+    
+    def step_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Same as step(), as x, y and brightness arrays."""
+        dst = self.composite()
+        xs, ys = np.nonzero(self._lit)
+        return xs, ys, dst[xs, ys]
 
 
 # ============================================================================
@@ -267,26 +508,56 @@ class EffectRunner:
         self.brightness = clamp01(brightness)
         self.invert = invert
         self._frame_delay = 1.0 / fps
-    
-    def _process_brightness(self, b: float) -> float:
-        """Apply global brightness and inversion."""
+        # The frame currently on the display, or None if unknown
+        self._shown: np.ndarray | None = None
+        # Frames missed during the last run() because rendering fell behind
+        self.dropped_frames = 0
+        # Frame being drawn, indexed [x, y]; it swaps with _shown once shown
+        self._frame = np.zeros((WIDTH, HEIGHT))
+    
+    def _process_brightness(self, b: np.ndarray) -> np.ndarray:
+        """Apply global brightness and inversion to an array of brightness."""
+        # A new array, since b can be a view of the effect's own buffers
         b = b * self.brightness
         if self.invert:
-            b = 1.0 - b
-        return clamp01(b)
+            np.subtract(1.0, b, out=b)
+        
+        # clamp01 for the whole array; fmin keeps NaN coming out as 1.0
+        np.abs(b, out=b)
+        return np.fmin(b, 1.0, out=b)
     
     def render_frame(self):
         """Render a single frame to the display."""
-        pixels = self.effect.step()
+        xs, ys, bs = self.effect.step_arrays()
         
-        scrollphathd.clear()
+        # Scatter the pixels into the frame; later duplicates win, as with
+        # one set_pixel() call per pixel
+        frame = self._frame
+        frame.fill(0.0)
+        frame[xs, ys] = self._process_brightness(bs)
+        
+        # Same as what's already on the display (a static or paused effect,
+        # or still blank): skip the redraw
+        shown = self._shown
+        if shown is not None and np.array_equal(frame, shown):
+            return
+        
+        self._display(frame)
         
-        for x, y, brightness in pixels:
-            b = self._process_brightness(brightness)
-            if 0 <= x < scrollphathd.width and 0 <= y < scrollphathd.height:
-                scrollphathd.set_pixel(x, y, b)
+        # Keep this frame to compare the next one against, and draw the
+        # next one into the other buffer
+        self._frame = shown if shown is not None else np.zeros_like(frame)
+        self._shown = frame
+    
+    def _display(self, frame: np.ndarray):
+        """Show frame by copying it over the whole display in one assignment."""
+        def paint(buffer):
+            w = min(buffer.shape[0], frame.shape[0])
+            h = min(buffer.shape[1], frame.shape[1])
+            buffer[:w, :h] = frame[:w, :h]
+            return buffer
         
-        scrollphathd.show()
+        scrollphathd.show(before_display=paint)
     
     def run(self, frames: int | None = None, reset: bool = True):
         """
@@ -299,12 +570,34 @@ class EffectRunner:
         if reset:
             self.effect.reset()
         
+        # Whatever is on the display now, the first frame is always drawn
+        self._shown = None
+        
+        # Clear once up front. Frames are written into the copy of the
+        # buffer that show() hands to before_display, so the buffer itself
+        # stays blank and doesn't need clearing every frame.
+        scrollphathd.clear()
+        
+        # Frames are paced against a perf_counter deadline, so the time spent
+        # in step()/show() comes out of the frame delay instead of adding to it
+        self.dropped_frames = 0
+        deadline = time.perf_counter()
+        
         count = 0
         while frames is None or count < frames:
             self.render_frame()
-            time.sleep(self._frame_delay)
             count += 1
             
+            deadline += self._frame_delay
+            sleep_for = deadline - time.perf_counter()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            elif sleep_for < -self._frame_delay:
+                # More than a frame behind: count the missed frames and
+                # restart the schedule rather than rushing to catch up
+                self.dropped_frames += int(-sleep_for / self._frame_delay)
+                deadline = time.perf_counter()
+            
             if frames is None and self.effect.is_done():
                 break
 
@@ -313,8 +606,10 @@ class EffectRunner:
 # ANIMATION RECORDING
 # ============================================================================
 
+import os
 import json
 import gzip
+from functools import lru_cache
 
 class AnimationRecorder:
     """
@@ -350,11 +645,80 @@ class AnimationRecorder:
                 break
     
     def save(self, filename: str):
-        """Save recorded animation to compressed file."""
+        """
+        Save recorded animation to compressed file.
+        
+        Filenames ending in .npz are written as compressed numpy arrays
+        (padded per-frame xs/ys/brightness plus pixel counts) that
+        BakedAnimation loads without any parsing. Filenames ending in .npy
+        are written uncompressed as one array of pixel records that
+        BakedAnimation memory-maps and reads frame by frame, for long
+        animations. Any other filename uses gzip-compressed JSON.
+        """
+        if filename.endswith(".npz"):
+            self._save_npz(filename)
+        elif filename.endswith(".npy"):
+            self._save_npy(filename)
+        else:
+            self._save_json(filename)
+        
+        print(f"Saved: {filename} ({len(self.frames)} frames)")
+    
+    def _padded_frames(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return padded (frame, pixel) x, y and brightness arrays plus pixel counts."""
+        # Pixels that can't be shown are dropped, so coordinates fit int16
+        frames = [pixel_arrays(frame, WIDTH, HEIGHT) for frame in self.frames]
+        count = len(frames)
+        max_pixels = max((len(xs) for xs, _, _ in frames), default=0)
+        
+        xs = np.zeros((count, max_pixels), np.int16)
+        ys = np.zeros((count, max_pixels), np.int16)
+        bs = np.zeros((count, max_pixels), np.float64)
+        counts = np.zeros(count, np.int32)
+        
+        for i, (fx, fy, fb) in enumerate(frames):
+            n = len(fx)
+            xs[i, :n] = fx
+            ys[i, :n] = fy
+            bs[i, :n] = fb
+            counts[i] = n
+        
+        return xs, ys, bs, counts
+    
+    def _save_npz(self, filename: str):
+        xs, ys, bs, counts = self._padded_frames()
+        
+        # Write through a file object so numpy doesn't append its own suffix
+        with open(filename, "wb") as f:
+            np.savez_compressed(
+                f,
+                version=2,
+                width=WIDTH,
+                height=HEIGHT,
+                fps=self.fps,
+                xs=xs,
+                ys=ys,
+                bs=bs,
+                counts=counts,
+            )
+    
+    def _save_npy(self, filename: str):
+        xs, ys, bs, counts = self._padded_frames()
+        
+        # One record per pixel slot; padding slots are marked with x = -1
+        records = np.zeros(xs.shape, PIXEL_RECORD)
+        records["x"] = np.where(np.arange(xs.shape[1]) < counts[:, None], xs, -1)
+        records["y"] = ys
+        records["b"] = bs
+        
+        with open(filename, "wb") as f:
+            np.save(f, records)
+    
+    def _save_json(self, filename: str):
         data = {
             "version": 1,
-            "width": scrollphathd.width,
-            "height": scrollphathd.height,
+            "width": WIDTH,
+            "height": HEIGHT,
             "fps": self.fps,
             "frame_count": len(self.frames),
             "frames": self.frames,
@@ -362,16 +726,46 @@ class AnimationRecorder:
         
         with gzip.open(filename, "wt", encoding="utf-8") as f:
             json.dump(data, f)
+
+
+# Layout of a pixel in the memory-mapped (.npy) baked-animation format
+PIXEL_RECORD = np.dtype([("x", np.int16), ("y", np.int16), ("b", np.float64)])
+
+
+@lru_cache(maxsize=8)
+def _load_anim(filename: str, mtime: float) -> tuple[tuple[tuple[int, int, float], ...], ...]:
+    """
+    Decode a baked animation into a tuple of frames of (x, y, brightness).
+    
+    Cached per (filename, mtime), so replaying or looping the same file
+    skips the decompression and parsing, and a re-recorded file is
+    picked up. Everything is immutable because the frames are shared.
+    """
+    if filename.endswith(".npz"):
+        with np.load(filename) as data:
+            xs, ys, bs, counts = data["xs"], data["ys"], data["bs"], data["counts"]
         
-        print(f"Saved: {filename} ({len(self.frames)} frames)")
+        return tuple(
+            tuple(zip(xs[i, :n].tolist(), ys[i, :n].tolist(), bs[i, :n].tolist()))
+            for i, n in enumerate(counts.tolist())
+        )
+    
+    with gzip.open(filename, "rt") as f:
+        data = json.load(f)
+    
+    return tuple(tuple(map(tuple, frame)) for frame in data["frames"])
 
 
 class BakedAnimation(Effect):
     """
     Plays back a pre-recorded animation.
     
+    .npy files are memory-mapped rather than loaded, so frames are read
+    from disk as they play and memory use doesn't grow with the length
+    of the animation.
+    
     Args:
-        filename: Path to .anim.gz file
+        filename: Path to .npy, .npz or .anim.gz file
         loop: Whether to loop playback
     """
     
@@ -381,10 +775,10 @@ class BakedAnimation(Effect):
         self.reset()
     
     def reset(self):
-        with gzip.open(self.filename, "rt") as f:
-            data = json.load(f)
-        
-        self.frames = data["frames"]
+        if self.filename.endswith(".npy"):
+            self.frames = np.load(self.filename, mmap_mode="r")
+        else:
+            self.frames = _load_anim(self.filename, os.path.getmtime(self.filename))
         self.index = 0
         self.done = False
     
@@ -401,7 +795,13 @@ class BakedAnimation(Effect):
             else:
                 self.done = True
         
-        return frame
+        if isinstance(frame, np.ndarray):
+            # A row of pixel records from a memory-mapped file
+            frame = frame[frame["x"] >= 0]
+            return list(zip(frame["x"].tolist(), frame["y"].tolist(), frame["b"].tolist()))
+        
+        # The cached frames are shared, so hand out a list of our own
+        return list(frame)
     
     def is_done(self):
         return self.done
@@ -467,6 +867,13 @@ class Comet(Effect):
         self.dy = dy
         self.tail_length = tail_length
         self.bounce = bounce
+        
+        # Brightness of each tail segment, newest first, for every tail
+        # length; the tail grows one segment per step until it is full
+        self._fades = [
+            [max(0.05, (1.0 - i / n) ** 2) for i in range(n)]
+            for n in range(tail_length + 1)
+        ]
         self.reset()
     
     def reset(self):
@@ -477,7 +884,7 @@ class Comet(Effect):
         self.vy = self.dy
     
     def step(self):
-        w, h = scrollphathd.width, scrollphathd.height
+        w, h = WIDTH, HEIGHT
         
         self.x += self.vx
         self.y += self.vy
@@ -495,12 +902,49 @@ class Comet(Effect):
         
         self.tail.appendleft((int(round(self.x)), int(round(self.y))))
         
-        pixels = []
-        for i, (tx, ty) in enumerate(self.tail):
-            brightness = (1.0 - i / len(self.tail)) ** 2
-            pixels.append((tx, ty, max(0.05, brightness)))
+        fades = self._fades[len(self.tail)]
+        return [(tx, ty, b) for (tx, ty), b in zip(self.tail, fades)]
+
+
+def _ripple_kernel(dist, radius, fade, xs, ys, bs):
+    # Collect the wave-front pixels of the [x, y] distance grid into the
+    # preallocated xs/ys/bs buffers and return how many were written
+    n = 0
+    w, h = dist.shape
+    for x in range(w):
+        for y in range(h):
+            delta = abs(dist[x, y] - radius)
+            
+            if delta < 1.0:
+                brightness = math.cos(delta * math.pi / 2)
+                brightness *= fade
+                
+                if brightness > 0.05:
+                    xs[n] = x
+                    ys[n] = y
+                    bs[n] = brightness
+                    n += 1
+    return n
+
+
+if njit is not None:
+    _ripple_kernel = njit(cache=True)(_ripple_kernel)
+else:
+    def _ripple_kernel(dist, radius, fade, xs, ys, bs):
+        # Same as above, computed with numpy; cos is only evaluated for the
+        # pixels in the wave front rather than the whole grid
+        delta = np.abs(dist - radius)
+        fx, fy = np.nonzero(delta < 1.0)
         
-        return pixels
+        brightness = np.cos(delta[fx, fy] * math.pi / 2)
+        brightness *= fade
+        
+        keep = brightness > 0.05
+        n = np.count_nonzero(keep)
+        xs[:n] = fx[keep]
+        ys[:n] = fy[keep]
+        bs[:n] = brightness[keep]
+        return n
 
 
 class WaveRipple(Effect):
@@ -530,37 +974,47 @@ class WaveRipple(Effect):
         self.radius = 0.0
         self.done = False
         
+        w, h = WIDTH, HEIGHT
+        
         if self._max_radius is None:
-            w, h = scrollphathd.width, scrollphathd.height
             self.max_radius = math.hypot(w, h)
         else:
             self.max_radius = self._max_radius
+        
+        # Distance of every pixel from the center, indexed [x, y]. It only
+        # depends on the center, so it is worked out once here.
+        self._dist = np.array([
+            [math.hypot(x - self.cx, y - self.cy) for y in range(h)]
+            for x in range(w)
+        ])
+        
+        # Buffers _ripple_kernel writes the wave front into
+        self._front_x = np.empty(w * h, dtype=np.int16)
+        self._front_y = np.empty(w * h, dtype=np.int16)
+        self._front_b = np.empty(w * h)
     
     def step(self):
+        return _pixel_list(*self.step_arrays())
+    
+    def step_arrays(self):
         if self.done:
-            return []
-        
-        pixels = []
-        w, h = scrollphathd.width, scrollphathd.height
+            return pixel_arrays([], WIDTH, HEIGHT)
         
-        for x in range(w):
-            for y in range(h):
-                dist = math.hypot(x - self.cx, y - self.cy)
-                delta = abs(dist - self.radius)
-                
-                if delta < 1.0:
-                    brightness = math.cos(delta * math.pi / 2)
-                    brightness *= max(0.0, 1.0 - self.radius / self.max_radius)
-                    
-                    if brightness > 0.05:
-                        pixels.append((x, y, brightness))
+        n = _ripple_kernel(
+            self._dist,
+            self.radius,
+            max(0.0, 1.0 - self.radius / self.max_radius),
+            self._front_x,
+            self._front_y,
+            self._front_b
+        )
         
         self.radius += self.speed
         
         if self.radius > self.max_radius:
             self.done = True
         
-        return pixels
+        return self._front_x[:n], self._front_y[:n], self._front_b[:n]
     
     def is_done(self):
         return self.done
@@ -592,6 +1046,9 @@ class ScannerSweep(Effect):
         self.speed = speed
         self.trail_length = trail_length
         self.bounce = bounce
+        
+        # Brightness of each trail position, newest first
+        self._fades = [max(0.05, (1.0 - i / trail_length) ** 2) for i in range(trail_length)]
         self.reset()
     
     def reset(self):
@@ -599,12 +1056,18 @@ class ScannerSweep(Effect):
         self.direction = 1
         self.trail = collections.deque(maxlen=self.trail_length)
         self.done = False
+        
+        # Pixel coordinates of the line drawn at each sweep position
+        if self.horizontal:
+            self._lines = [[(p, y) for y in range(HEIGHT)] for p in range(WIDTH)]
+        else:
+            self._lines = [[(x, p) for x in range(WIDTH)] for p in range(HEIGHT)]
     
     def step(self):
         if self.done:
             return []
         
-        w, h = scrollphathd.width, scrollphathd.height
+        w, h = WIDTH, HEIGHT
         limit = w - 1 if self.horizontal else h - 1
         
         self.pos += self.direction * self.speed
@@ -620,15 +1083,8 @@ class ScannerSweep(Effect):
         self.trail.appendleft(int(self.pos))
         
         pixels = []
-        for i, p in enumerate(self.trail):
-            brightness = (1.0 - i / self.trail_length) ** 2
-            
-            if self.horizontal:
-                for y in range(h):
-                    pixels.append((p, y, max(0.05, brightness)))
-            else:
-                for x in range(w):
-                    pixels.append((x, p, max(0.05, brightness)))
+        for p, brightness in zip(self.trail, self._fades):
+            pixels += [(x, y, brightness) for x, y in self._lines[p]]
         
         return pixels
     
@@ -655,11 +1111,14 @@ class ZigZagSweep(Effect):
         self.speed = speed
         self.trail_length = trail_length
         self.bounce = bounce
+        
+        # Brightness of each trail position, newest first
+        self._fades = [max(0.05, (1.0 - i / trail_length) ** 2) for i in range(trail_length)]
         self.reset()
     
     def reset(self):
-        self.w = scrollphathd.width
-        self.h = scrollphathd.height
+        self.w = WIDTH
+        self.h = HEIGHT
         self.row = 0
         self.col = 0
         self.x_dir = 1
@@ -688,12 +1147,7 @@ class ZigZagSweep(Effect):
         
         self.trail.appendleft((self.col, self.row))
         
-        pixels = []
-        for i, (x, y) in enumerate(self.trail):
-            brightness = (1.0 - i / self.trail_length) ** 2
-            pixels.append((x, y, max(0.05, brightness)))
-        
-        return pixels
+        return [(x, y, b) for (x, y), b in zip(self.trail, self._fades)]
     
     def is_done(self):
         return self.done
@@ -717,40 +1171,57 @@ class ExpandingBox(Effect):
         self.cy = cy
         self.speed = speed
         self._max_radius = max_radius
+        
+        # Outline pixel arrays by (radius, cx, cy). The box steps through
+        # the same few integer radii every time it plays, so this is kept
+        # across resets.
+        self._outlines = {}
         self.reset()
     
     def reset(self):
         self.radius = 0.0
         self.done = False
         
+        # Column and row coordinates, broadcast against each other in step()
+        self._xs = np.arange(WIDTH)[:, None]
+        self._ys = np.arange(HEIGHT)[None, :]
+        
         if self._max_radius is None:
-            w, h = scrollphathd.width, scrollphathd.height
+            w, h = WIDTH, HEIGHT
             self.max_radius = math.hypot(w, h)
         else:
             self.max_radius = self._max_radius
     
     def step(self):
+        return _pixel_list(*self.step_arrays())
+    
+    def step_arrays(self):
         if self.done:
-            return []
+            return pixel_arrays([], WIDTH, HEIGHT)
         
-        pixels = []
         r = int(self.radius)
         
-        for x in range(scrollphathd.width):
-            for y in range(scrollphathd.height):
-                on_edge = (
-                    (abs(x - self.cx) == r and abs(y - self.cy) <= r) or
-                    (abs(y - self.cy) == r and abs(x - self.cx) <= r)
-                )
-                if on_edge:
-                    pixels.append((x, y, 1.0))
+        key = (r, self.cx, self.cy)
+        outline = self._outlines.get(key)
+        if outline is None:
+            outline = self._outlines[key] = self._outline(r)
         
         self.radius += self.speed
         
         if self.radius > self.max_radius:
             self.done = True
         
-        return pixels
+        return outline
+    
+    def _outline(self, r: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the pixel arrays of the outline at integer radius r."""
+        # Test every display pixel at once; nonzero() walks the [x, y]
+        # mask in the same x-then-y order as the original nested loops
+        adx = np.abs(self._xs - self.cx)
+        ady = np.abs(self._ys - self.cy)
+        on_edge = ((adx == r) & (ady <= r)) | ((ady == r) & (adx <= r))
+        xs, ys = np.nonzero(on_edge)
+        return xs, ys, np.ones(len(xs))
     
     def is_done(self):
         return self.done
@@ -767,11 +1238,26 @@ class PulseFade(Effect):
     def reset(self):
         self.phase = 0.0
         self.done = False
+        # Every display pixel, in the order they are emitted
+        self._coords = [(x, y) for x in range(WIDTH) for y in range(HEIGHT)]
+        self._xs, self._ys = np.divmod(np.arange(WIDTH * HEIGHT), HEIGHT)
     
     def step(self):
         if self.done:
             return []
         
+        brightness = self._advance()
+        return [(x, y, brightness) for x, y in self._coords]
+    
+    def step_arrays(self):
+        if self.done:
+            return pixel_arrays([], WIDTH, HEIGHT)
+        
+        brightness = self._advance()
+        return self._xs, self._ys, np.full(len(self._xs), brightness)
+    
+    def _advance(self) -> float:
+        """Move the pulse on one frame and return this frame's brightness."""
         brightness = (math.sin(self.phase) + 1.0) / 2.0
         self.phase += self.speed
         
@@ -781,12 +1267,7 @@ class PulseFade(Effect):
             else:
                 self.done = True
         
-        pixels = []
-        for x in range(scrollphathd.width):
-            for y in range(scrollphathd.height):
-                pixels.append((x, y, brightness))
-        
-        return pixels
+        return brightness
     
     def is_done(self):
         return self.done
@@ -796,6 +1277,80 @@ class PulseFade(Effect):
 # CHARACTER EFFECTS
 # ============================================================================
 
+def _pacman_kernel(cx, cy, ox, oy, turn, edge, mouth_angle, xs, ys, bs):
+    # Collect the body pixels of a Pac-Man whose centre lies in pixel
+    # (cx, cy), given the table of offsets around it, into the xs/ys/bs
+    # buffers and return how many were written
+    n = 0
+    for i in range(len(ox)):
+        ix = cx + ox[i]
+        iy = cy + oy[i]
+        if not (0 <= ix < WIDTH and 0 <= iy < HEIGHT):
+            continue
+        
+        # Mouth cutout
+        if turn[i] < mouth_angle:
+            continue
+        
+        xs[n] = ix
+        ys[n] = iy
+        bs[n] = edge[i]
+        n += 1
+    return n
+
+
+if njit is not None:
+    _pacman_kernel = njit(cache=True)(_pacman_kernel)
+else:
+    def _pacman_kernel(cx, cy, ox, oy, turn, edge, mouth_angle, xs, ys, bs):
+        # Same as above, computed with numpy
+        ix = cx + ox
+        iy = cy + oy
+        keep = (ix >= 0) & (ix < WIDTH) & (iy >= 0) & (iy < HEIGHT) & ~(turn < mouth_angle)
+        
+        n = np.count_nonzero(keep)
+        xs[:n] = ix[keep]
+        ys[:n] = iy[keep]
+        bs[:n] = edge[keep]
+        return n
+
+
+def _pacman_table(fx: float, fy: float, radius: float, dir_angle: float) -> tuple[np.ndarray, ...]:
+    """
+    Return the pixel offsets (ox, oy) inside a Pac-Man body of the given
+    radius facing dir_angle, for a centre at fraction (fx, fy) of its
+    pixel. Alongside each offset come how far the pixel is turned from
+    the facing direction (compared with the mouth angle every frame)
+    and its soft-edge brightness. Offsets are in x-then-y order.
+    """
+    # ix + 0.5 - x comes out exactly the same as ox + 0.5 - fx, since
+    # both round the same value once, so the table is exact for any
+    # centre with these fractional parts
+    reach = range(-int(radius) - 1, int(radius) + 2)
+    table = []
+    for ox in reach:
+        for oy in reach:
+            dx = ox + 0.5 - fx
+            dy = oy + 0.5 - fy
+            dist = math.hypot(dx, dy)
+            if dist > radius:
+                continue
+            
+            angle = math.atan2(dy, dx)
+            rel = (angle - dir_angle + math.pi * 3) % (2 * math.pi) - math.pi
+            
+            brightness = 1.0
+            if dist > radius - 0.6:
+                brightness = clamp01(radius - dist + 0.6)
+            
+            table.append((ox, oy, abs(rel), brightness))
+    
+    if not table:
+        return (np.empty(0, np.intp), np.empty(0, np.intp), np.empty(0), np.empty(0))
+    ox, oy, turn, edge = zip(*table)
+    return (np.array(ox, np.intp), np.array(oy, np.intp), np.array(turn), np.array(edge))
+
+
 class PacMan(Effect):
     """
     Animated Pac-Man with chomping mouth.
@@ -832,12 +1387,24 @@ class PacMan(Effect):
         self.y = self.start_y
         self.phase = 0.0
         self.done = False
+        
+        # Pixel tables by (x fraction, y fraction, radius, direction); a
+        # constant speed only ever visits a few fractions, so this stays small
+        self._tables = {}
+        
+        # Scratch buffers _pacman_kernel writes the body pixels into
+        self._body_x = np.empty(WIDTH * HEIGHT, dtype=np.int16)
+        self._body_y = np.empty(WIDTH * HEIGHT, dtype=np.int16)
+        self._body_b = np.empty(WIDTH * HEIGHT)
     
     def step(self):
+        return _pixel_list(*self.step_arrays())
+    
+    def step_arrays(self):
         if self.done:
-            return []
+            return pixel_arrays([], WIDTH, HEIGHT)
         
-        w, h = scrollphathd.width, scrollphathd.height
+        w, h = WIDTH, HEIGHT
         
         self.x += self.x_speed
         self.y += self.y_speed
@@ -848,7 +1415,7 @@ class PacMan(Effect):
         else:
             if not (0 <= self.x < w and 0 <= self.y < h):
                 self.done = True
-                return []
+                return pixel_arrays([], WIDTH, HEIGHT)
         
         # Chomp animation
         self.phase += self.chomp_speed
@@ -857,39 +1424,24 @@ class PacMan(Effect):
         
         dir_angle = math.atan2(self.y_speed, self.x_speed)
         
-        pixels = []
-        
-        xmin = int(self.x - self.radius - 1)
-        xmax = int(self.x + self.radius + 1)
-        ymin = int(self.y - self.radius - 1)
-        ymax = int(self.y + self.radius + 1)
-        
-        for ix in range(xmin, xmax + 1):
-            for iy in range(ymin, ymax + 1):
-                if not (0 <= ix < w and 0 <= iy < h):
-                    continue
-                
-                dx = ix + 0.5 - self.x
-                dy = iy + 0.5 - self.y
-                dist = math.hypot(dx, dy)
-                
-                if dist > self.radius:
-                    continue
-                
-                angle = math.atan2(dy, dx)
-                rel = (angle - dir_angle + math.pi * 3) % (2 * math.pi) - math.pi
-                
-                # Mouth cutout
-                if abs(rel) < mouth_angle:
-                    continue
-                
-                brightness = 1.0
-                if dist > self.radius - 0.6:
-                    brightness = clamp01(self.radius - dist + 0.6)
-                
-                pixels.append((ix, iy, brightness))
+        # Everything about the pixels around the centre except the mouth
+        # only depends on where the centre sits within its pixel (and the
+        # radius and direction), so it is looked up rather than recomputed
+        # with hypot()/atan2() every frame
+        cx = math.floor(self.x)
+        cy = math.floor(self.y)
+        key = (self.x - cx, self.y - cy, self.radius, dir_angle)
+        table = self._tables.get(key)
+        if table is None:
+            if len(self._tables) >= 256:
+                self._tables.clear()
+            table = self._tables[key] = _pacman_table(*key)
         
-        return pixels
+        n = _pacman_kernel(
+            cx, cy, *table, mouth_angle,
+            self._body_x, self._body_y, self._body_b,
+        )
+        return self._body_x[:n], self._body_y[:n], self._body_b[:n]
     
     def is_done(self):
         return self.done
@@ -904,9 +1456,15 @@ class StaticPixels(Effect):
     
     def __init__(self, pixels: list[tuple[int, int, float]]):
         self.pixels = pixels
+        # The pixels never change, so split them into arrays once rather
+        # than every frame
+        self._arrays = pixel_arrays(pixels, WIDTH, HEIGHT)
     
     def step(self):
         return self.pixels
+    
+    def step_arrays(self):
+        return self._arrays
 
 
 class FunctionEffect(Effect):
@@ -925,6 +1483,57 @@ class FunctionEffect(Effect):
         self.gen = self.generator_func()
 
 
+class FrameListEffect(Effect):
+    """
+    Play back a list of precomputed frames, without the generator
+    machinery of FunctionEffect.
+    
+    Args:
+        frames: Frames, each a list of (x, y, brightness) tuples
+        loop: Whether to loop playback
+    """
+    
+    def __init__(self, frames, loop: bool = True):
+        self.frames = [list(frame) for frame in frames]
+        self.loop = loop
+        # Each frame as arrays, converted once instead of every time it plays
+        self._arrays = [pixel_arrays(frame, WIDTH, HEIGHT) for frame in self.frames]
+        self.reset()
+    
+    def reset(self):
+        self.index = 0
+        self.done = False
+    
+    def step(self):
+        if self.done:
+            return []
+        
+        # The stored frames are reused every loop, so hand out a copy
+        return list(self.frames[self._advance()])
+    
+    def step_arrays(self):
+        if self.done:
+            return pixel_arrays([], WIDTH, HEIGHT)
+        
+        return self._arrays[self._advance()]
+    
+    def _advance(self) -> int:
+        """Move on one frame and return the index of the frame to show."""
+        index = self.index
+        self.index += 1
+        
+        if self.index >= len(self.frames):
+            if self.loop:
+                self.index = 0
+            else:
+                self.done = True
+        
+        return index
+    
+    def is_done(self):
+        return self.done
+
+
 # ============================================================================
 # DEMOS
 # ============================================================================
@@ -35,11 +35,19 @@ matrix = [
 ]
 
 def update_display_loop(matrix):
-    #Iterate over matrix and set each pixel according to matrix values
+    #Set each pixel according to matrix values, then keep showing them.
+    #The display buffer keeps its pixels between frames, so only values
+    #that have changed in matrix since the last frame are written again
+    last = None
     while True:
-        for y in range(0, 7):
-            for x in range(0, 17):
-                scrollphathd.pixel(x, y, (matrix[y][x]))
+        current = np.array(matrix, dtype=float)
+        if last is None:
+            changed = np.ones(current.shape, dtype=bool)
+        else:
+            changed = current != last
+        for y, x in np.argwhere(changed):
+            scrollphathd.pixel(int(x), int(y), current[y, x])
+        last = current
         scrollphathd.show()
 
 if __name__ == '__main__':
@@ -1,8 +1,9 @@
 #!/usr/bin/env python
 
 import itertools
+import numpy as np
 import scrollphathd
-from random import shuffle, randint
+from random import randint
 
 scrollphathd.set_brightness(0.9)
 class Sparkle:
@@ -31,10 +32,10 @@ class Sparkle:
         Advance the sparkle one step and return (x, y, normalized_brightness).
         Behavior mirrors `Sparkle.step()`.
         """
-        if self.brightness >= self.speed:
+        # rising until the peak, then falling until dark, then stopped
+        if self.direction > 0 and self.brightness >= self.speed:
             self.direction = -1
-
-        if self.brightness <= 0:
+        elif self.direction < 0 and self.brightness <= 0:
             self.direction = 0
 
         self.brightness += self.direction
@@ -55,6 +56,78 @@ class Sparkle:
         self.direction = 1
         self.speed = self._fixed_speed if self._fixed_speed is not None else randint(2, 50)
 
+class SparkleField:
+    """
+    A set of sparkles kept in parallel arrays (one entry per sparkle)
+    instead of one `Sparkle` object each, so every active sparkle is
+    advanced with a few numpy operations per frame.
+
+    Each sparkle cycles exactly like a `Sparkle`. Sparkles are idle until
+    started with `start_random()`, and go idle again (and reset) when
+    their cycle finishes.
+    """
+
+    def __init__(self, xs, ys, speed: int | None = None):
+        """
+        Args:
+            xs, ys: Pixel coordinates, one pair per sparkle.
+            speed: None to randomize each reset, or a positive int to fix cycle length.
+        """
+        self.xs = np.asarray(xs, dtype=np.intp)
+        self.ys = np.asarray(ys, dtype=np.intp)
+        self._fixed_speed = speed
+
+        n = len(self.xs)
+        self.brightness = np.empty(n, dtype=np.int16)
+        self.direction = np.empty(n, dtype=np.int8)
+        self.speed = np.empty(n, dtype=np.int16)
+        self.active = np.zeros(n, dtype=bool)
+        self._reset(np.ones(n, dtype=bool))
+
+    def _reset(self, which):
+        """Reset the sparkles selected by the `which` mask to start a new cycle."""
+        self.brightness[which] = 1
+        self.direction[which] = 1
+        if self._fixed_speed is not None:
+            self.speed[which] = self._fixed_speed
+        else:
+            self.speed[which] = np.random.randint(2, 51, np.count_nonzero(which))
+
+    def active_count(self):
+        """Return how many sparkles are currently cycling."""
+        return np.count_nonzero(self.active)
+
+    def start_random(self):
+        """Start one randomly chosen idle sparkle, if there is one."""
+        idle = np.flatnonzero(~self.active)
+        if len(idle):
+            self.active[idle[randint(0, len(idle) - 1)]] = True
+
+    def step_all(self):
+        """
+        Advance every active sparkle one step and return their
+        (xs, ys, normalized_brightness) arrays. Sparkles whose cycle
+        finishes on this step are included, then reset and made idle.
+        """
+        active = self.active
+        b, d, speed = self.brightness, self.direction, self.speed
+
+        # same state machine as Sparkle.step(), for all active sparkles at once
+        peak = active & (d > 0) & (b >= speed)
+        dark = active & (d < 0) & (b <= 0)
+        d[peak] = -1
+        d[dark] = 0
+        b[active] += d[active]
+
+        xs, ys = self.xs[active], self.ys[active]
+        normalized_brightness = b[active] / speed[active]
+
+        done = active & (b == 0)
+        self._reset(done)
+        active &= ~done
+
+        return xs, ys, normalized_brightness
+
 def sparkle_fill_light(repeat=0):
     """
     Fill the matrix with sparkles by randomly selecting up to 100 active sparkles.
@@ -66,25 +139,28 @@ def sparkle_fill_light(repeat=0):
 
     # Fixed speed for all sparkles
     sparkle_speed = 50
-    sparkles = [Sparkle(x, y, sparkle_speed) for x, y in pixels]
+    xs, ys = zip(*pixels)
+    sparkles = SparkleField(xs, ys, sparkle_speed)
 
-    active = []
-    run_count = 0
-    while run_count <= repeat:
-        shuffle(sparkles)
+    # brightness of every pixel, indexed [x, y]; each frame's sparkles are
+    # scattered into it and it is copied onto the display in one go
+    canvas = np.zeros((scrollphathd.width, scrollphathd.height))
 
-        # maintain up to 100 active sparkles
-        if len(active) < 100:
-            active.append(sparkles.pop(0))
+    def paint(buffer):
+        w = min(buffer.shape[0], canvas.shape[0])
+        h = min(buffer.shape[1], canvas.shape[1])
+        buffer[:w, :h] = canvas[:w, :h]
+        return buffer
 
-        for sparkle in active:
-            scrollphathd.set_pixel(*sparkle.step())
+    run_count = 0
+    while run_count <= repeat:
+        # maintain up to 100 active sparkles, starting a random idle one
+        if sparkles.active_count() < 100:
+            sparkles.start_random()
 
-            if sparkle.is_done():
-                active.remove(sparkle)
-                sparkle.reset()
-                sparkles.insert(randint(0, len(sparkles)), sparkle)
-        scrollphathd.show()
+        xs, ys, bs = sparkles.step_all()
+        canvas[xs, ys] = bs
+        scrollphathd.show(before_display=paint)
         if repeat > 0:
             run_count += 1
 